@@ -4,48 +4,37 @@ FastAPI Dependencies Module
 
 import logging
 from asyncio import Event, Lock, Queue
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Set, cast
 
 from api_utils.context_types import QueueItem
+from api_utils.server_state import state
 
+# The getters below are plain attribute reads on the global state. They are
+# declared async so FastAPI runs them inline on the event loop instead of
+# dispatching each one through its threadpool.
 
-def get_logger() -> logging.Logger:
-    from api_utils.server_state import state
 
+async def get_logger() -> logging.Logger:
     return state.logger
 
 
-def get_log_ws_manager():
-    from api_utils.server_state import state
-
+async def get_log_ws_manager():
     return state.log_ws_manager
 
 
-def get_request_queue() -> "Queue[QueueItem]":
-    from typing import cast
-
-    from api_utils.server_state import state
-
+async def get_request_queue() -> "Queue[QueueItem]":
     return cast("Queue[QueueItem]", state.request_queue)
 
 
-def get_processing_lock() -> Lock:
-    from typing import cast
-
-    from api_utils.server_state import state
-
+async def get_processing_lock() -> Lock:
     return cast(Lock, state.processing_lock)
 
 
-def get_worker_task():
-    from api_utils.server_state import state
-
+async def get_worker_task():
     return state.worker_task
 
 
-def get_server_state() -> Dict[str, Any]:
-    from api_utils.server_state import state
-
+async def get_server_state() -> Dict[str, Any]:
     # Return immutable snapshot to prevent downstream modifications to global references
     return dict(
         is_initializing=state.is_initializing,
@@ -55,37 +44,23 @@ def get_server_state() -> Dict[str, Any]:
     )
 
 
-def get_page_instance():
-    from api_utils.server_state import state
-
+async def get_page_instance():
     return state.page_instance
 
 
-def get_model_list_fetch_event() -> Event:
-    from typing import cast
-
-    from api_utils.server_state import state
-
+async def get_model_list_fetch_event() -> Event:
     return cast(Event, state.model_list_fetch_event)
 
 
-def get_parsed_model_list() -> List[Dict[str, Any]]:
-    from api_utils.server_state import state
-
+async def get_parsed_model_list() -> List[Dict[str, Any]]:
     return state.parsed_model_list
 
 
-def get_excluded_model_ids() -> Set[str]:
-    from api_utils.server_state import state
-
+async def get_excluded_model_ids() -> Set[str]:
     return state.excluded_model_ids
 
 
-def get_current_ai_studio_model_id() -> str:
-    from typing import cast
-
-    from api_utils.server_state import state
-
+async def get_current_ai_studio_model_id() -> str:
     return cast(str, state.current_ai_studio_model_id)
 
 
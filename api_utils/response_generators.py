@@ -642,22 +642,22 @@ async def gen_sse_from_playwright(
             )
 
             orchestrator = get_function_calling_orchestrator()
-            tool_calls_deltas = orchestrator.format_streaming_tool_calls(function_calls)
-            for delta in tool_calls_deltas:
-                chunk = {
-                    "id": f"chatcmpl-{req_id}",
-                    "object": "chat.completion.chunk",
-                    "created": int(time.time()),
-                    "model": model_name_for_stream,
-                    "choices": [
-                        {
-                            "index": 0,
-                            "delta": {"tool_calls": [delta]},
-                            "finish_reason": None,
-                        }
-                    ],
-                }
-                yield f"data: {json.dumps(chunk, ensure_ascii=False, separators=(',', ':'))}\n\n"
+            # Deltas arrive pre-serialized; splice them into a fixed envelope
+            # instead of building and re-encoding a chunk dict per delta
+            chunk_prefix = (
+                'data: {"id":'
+                + json.dumps(f"chatcmpl-{req_id}", ensure_ascii=False)
+                + ',"object":"chat.completion.chunk","created":'
+                + str(int(time.time()))
+                + ',"model":'
+                + json.dumps(model_name_for_stream, ensure_ascii=False)
+                + ',"choices":[{"index":0,"delta":{"tool_calls":['
+            )
+            chunk_suffix = ']},"finish_reason":null}]}\n\n'
+            for delta_json in orchestrator.format_streaming_tool_calls_json(
+                function_calls
+            ):
+                yield chunk_prefix + delta_json + chunk_suffix
 
             yield generate_sse_stop_chunk(
                 req_id, model_name_for_stream, "tool_calls", usage_stats
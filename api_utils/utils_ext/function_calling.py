@@ -9,14 +9,17 @@ This module provides:
 Implements Phase 1 of ADR-001: Native Function Calling Architecture.
 """
 
+import copy
 import json
 import logging
-import uuid
+import secrets
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from config.settings import FUNCTION_CALLING_DEBUG
 from logging_utils.fc_debug import FCModule, get_fc_logger
@@ -61,6 +64,18 @@ TYPE_MAP_LOWER: Dict[str, str] = {
 # Type alias for MCP response items
 MCPResponseItem = Dict[str, Any]
 
+# Pre-built JSON encoders for the serialization hot paths. Binding .encode once
+# skips json.dumps' per-call kwarg handling and encoder construction.
+# Client-visible strings keep the json.dumps(..., ensure_ascii=False) format.
+_dumps = json.JSONEncoder(ensure_ascii=False).encode
+_pretty_encoder = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+# Compact encoding for the pre-serialized SSE delta envelopes
+_compact_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+# Encoding used as the schema conversion cache key. Keys are not sorted:
+# property order is part of the declaration sent to Gemini, so tools that
+# differ only in key order must not share a cached result.
+_cache_key_encoder = json.JSONEncoder(separators=(",", ":")).encode
+
 
 # =============================================================================
 # Configuration Types
@@ -80,7 +95,7 @@ class FunctionCallingMode(str, Enum):
     AUTO = "auto"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FunctionCallingConfig:
     """Configuration for function calling behavior.
 
@@ -102,30 +117,40 @@ class FunctionCallingConfig:
 
     @classmethod
     def from_settings(cls) -> "FunctionCallingConfig":
-        """Create configuration from environment settings."""
-        from config.settings import (
-            FUNCTION_CALLING_CLEAR_BETWEEN_REQUESTS,
-            FUNCTION_CALLING_DEBUG,
-            FUNCTION_CALLING_MODE,
-            FUNCTION_CALLING_NATIVE_FALLBACK,
-            FUNCTION_CALLING_NATIVE_RETRY_COUNT,
-            FUNCTION_CALLING_UI_TIMEOUT,
-        )
+        """Create configuration from environment settings.
 
-        mode_str = FUNCTION_CALLING_MODE.lower()
-        try:
-            mode = FunctionCallingMode(mode_str)
-        except ValueError:
-            mode = FunctionCallingMode.EMULATED
-
-        return cls(
-            mode=mode,
-            native_fallback=FUNCTION_CALLING_NATIVE_FALLBACK,
-            ui_timeout_ms=FUNCTION_CALLING_UI_TIMEOUT,
-            native_retry_count=FUNCTION_CALLING_NATIVE_RETRY_COUNT,
-            clear_between_requests=FUNCTION_CALLING_CLEAR_BETWEEN_REQUESTS,
-            debug=FUNCTION_CALLING_DEBUG,
-        )
+        Settings are fixed at runtime, so the (frozen) instance is built once
+        and shared. Use _config_from_settings.cache_clear() to re-read them.
+        """
+        return _config_from_settings(cls)
+
+
+@lru_cache(maxsize=1)
+def _config_from_settings(config_cls: type) -> FunctionCallingConfig:
+    """Build a FunctionCallingConfig (or subclass) from config.settings."""
+    from config.settings import (
+        FUNCTION_CALLING_CLEAR_BETWEEN_REQUESTS,
+        FUNCTION_CALLING_DEBUG,
+        FUNCTION_CALLING_MODE,
+        FUNCTION_CALLING_NATIVE_FALLBACK,
+        FUNCTION_CALLING_NATIVE_RETRY_COUNT,
+        FUNCTION_CALLING_UI_TIMEOUT,
+    )
+
+    mode_str = FUNCTION_CALLING_MODE.lower()
+    try:
+        mode = FunctionCallingMode(mode_str)
+    except ValueError:
+        mode = FunctionCallingMode.EMULATED
+
+    return config_cls(
+        mode=mode,
+        native_fallback=FUNCTION_CALLING_NATIVE_FALLBACK,
+        ui_timeout_ms=FUNCTION_CALLING_UI_TIMEOUT,
+        native_retry_count=FUNCTION_CALLING_NATIVE_RETRY_COUNT,
+        clear_between_requests=FUNCTION_CALLING_CLEAR_BETWEEN_REQUESTS,
+        debug=FUNCTION_CALLING_DEBUG,
+    )
 
 
 # =============================================================================
@@ -529,26 +554,28 @@ class SchemaConverter:
     # -------------------------------------------------------------------------
     # SUPPORTED FIELDS (Tested & Working):
     # -------------------------------------------------------------------------
-    ALLOWED_SCHEMA_FIELDS = {
-        "type",  # Data type (REQUIRED on every property)
-        "format",  # Format hint (e.g., "date-time", "email")
-        "description",  # Human-readable description
-        "nullable",  # Whether null is allowed
-        "enum",  # Allowed values
-        "maxItems",  # Maximum array items
-        "minItems",  # Minimum array items
-        "properties",  # Object properties
-        "required",  # Required property names
-        "items",  # Array item schema
-        "minProperties",  # Minimum object properties
-        "maxProperties",  # Maximum object properties
-        "minimum",  # Minimum numeric value
-        "maximum",  # Maximum numeric value
-        "minLength",  # Minimum string length
-        "maxLength",  # Maximum string length
-        "pattern",  # Regex pattern for strings
-        "propertyOrdering",  # Order of properties for display
-    }
+    ALLOWED_SCHEMA_FIELDS = frozenset(
+        {
+            "type",  # Data type (REQUIRED on every property)
+            "format",  # Format hint (e.g., "date-time", "email")
+            "description",  # Human-readable description
+            "nullable",  # Whether null is allowed
+            "enum",  # Allowed values
+            "maxItems",  # Maximum array items
+            "minItems",  # Minimum array items
+            "properties",  # Object properties
+            "required",  # Required property names
+            "items",  # Array item schema
+            "minProperties",  # Minimum object properties
+            "maxProperties",  # Maximum object properties
+            "minimum",  # Minimum numeric value
+            "maximum",  # Maximum numeric value
+            "minLength",  # Minimum string length
+            "maxLength",  # Maximum string length
+            "pattern",  # Regex pattern for strings
+            "propertyOrdering",  # Order of properties for display
+        }
+    )
 
     # -------------------------------------------------------------------------
     # UNSUPPORTED FIELDS (AI Studio rejects these with "Unknown key" error):
@@ -580,7 +607,12 @@ class SchemaConverter:
     # Fields that require special handling (recursion, conversion)
     # anyOf/oneOf/allOf are converted to first non-null type since AI Studio
     # doesn't support union types
-    SPECIAL_FIELDS = {"type", "properties", "items", "anyOf", "const", "oneOf", "allOf"}
+    SPECIAL_FIELDS = frozenset(
+        {"type", "properties", "items", "anyOf", "const", "oneOf", "allOf"}
+    )
+
+    # Union keywords, in the order they are resolved
+    LOGIC_FIELDS = ("anyOf", "oneOf", "allOf")
 
     # Legacy TYPE_MAP - kept for backwards compatibility
     # Use type_map property for configurable case
@@ -631,6 +663,11 @@ class SchemaConverter:
         Supports both standard OpenAI format and flat format (e.g. from opencode).
         Safely ignores non-function tools.
 
+        Clients resend the same tools on every request, so conversions are
+        memoized on the JSON of the tool and the converter configuration. The
+        original dict is converted, so key order is preserved, and each call
+        returns a fresh copy that the caller is free to mutate.
+
         Args:
             openai_tool: OpenAI tool definition.
 
@@ -640,6 +677,42 @@ class SchemaConverter:
         Raises:
             SchemaConversionError: If the tool is a function but the format is invalid.
         """
+        if not isinstance(openai_tool, dict):
+            return None
+        if openai_tool.get("type") != "function":
+            # Ignored without building a cache key for the whole tool
+            return self._convert_tool(openai_tool)
+
+        try:
+            tool_json = _cache_key_encoder(openai_tool)
+        except ValueError as e:
+            # The JSON encoder only raises ValueError for circular references
+            raise SchemaConversionError(
+                "Tool definition contains a reference cycle"
+            ) from e
+        except TypeError:
+            # Not JSON serializable, so it cannot be used as a cache key
+            return self._convert_tool(openai_tool)
+
+        from config.settings import FUNCTION_CALLING_UPPERCASE_TYPES
+
+        cache_key = (type(self), tool_json, FUNCTION_CALLING_UPPERCASE_TYPES)
+        try:
+            declaration = _conversion_cache[cache_key]
+            _conversion_cache.move_to_end(cache_key)
+        except KeyError:
+            # Copy on store: compliant parameters are shared with openai_tool
+            declaration = copy.deepcopy(self._convert_tool(openai_tool))
+            _conversion_cache[cache_key] = declaration
+            if len(_conversion_cache) > CONVERSION_CACHE_SIZE:
+                _conversion_cache.popitem(last=False)
+        return copy.deepcopy(declaration)
+
+    def _convert_tool(self, openai_tool: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert a single OpenAI tool definition without memoization.
+
+        See convert_tool for arguments, return value and errors.
+        """
         if not isinstance(openai_tool, dict):
             return None
 
@@ -668,20 +741,24 @@ class SchemaConverter:
             logger.debug(f"Converting OpenAI tool to Gemini: {name}")
             fc_logger.debug(FCModule.SCHEMA, f"Converting tool: {name}")
 
+        description = source.get("description")
+        parameters = source.get("parameters")
+
         # Build Gemini FunctionDeclaration
         gemini_declaration: Dict[str, Any] = {"name": name}
 
         # Description is optional but recommended
-        description = source.get("description")
-        if description and isinstance(description, str):
+        if isinstance(description, str) and description:
             gemini_declaration["description"] = description
 
-        # Parameters are optional (some functions have no params)
-        parameters = source.get("parameters")
-        if parameters and isinstance(parameters, dict):
-            # Strip unsupported fields but keep the rest
-            clean_params = self._clean_parameters(parameters)
-            gemini_declaration["parameters"] = clean_params
+        # Parameters are optional (some functions have no params). Unsupported
+        # fields are stripped; already compliant schemas are shared as-is.
+        if isinstance(parameters, dict) and parameters:
+            gemini_declaration["parameters"] = (
+                self._clean_parameters(parameters)
+                if self._needs_cleaning(parameters)
+                else parameters
+            )
 
         if FUNCTION_CALLING_DEBUG:
             logger.debug(
@@ -707,14 +784,21 @@ class SchemaConverter:
                 f"Tools must be a list, got {type(openai_tools).__name__}"
             )
 
-        declarations: List[Dict[str, Any]] = []
-        for i, tool in enumerate(openai_tools):
-            try:
-                declaration = self.convert_tool(tool)
-                if declaration:
-                    declarations.append(declaration)
-            except SchemaConversionError as e:
-                raise SchemaConversionError(f"Error converting tool at index {i}: {e}")
+        convert = self.convert_tool
+        try:
+            declarations: List[Dict[str, Any]] = [
+                declaration for declaration in map(convert, openai_tools) if declaration
+            ]
+        except SchemaConversionError:
+            # Slow path only on failure: locate the offending tool for the message
+            for i, tool in enumerate(openai_tools):
+                try:
+                    convert(tool)
+                except SchemaConversionError as e:
+                    raise SchemaConversionError(
+                        f"Error converting tool at index {i}: {e}"
+                    )
+            raise
 
         if FUNCTION_CALLING_DEBUG:
             fc_logger.info(
@@ -735,8 +819,54 @@ class SchemaConverter:
         Returns:
             JSON string suitable for pasting into AI Studio function declarations textarea.
         """
+        if indent is None:
+            return _dumps(declarations)
+        if indent == 2:
+            return _pretty_encoder(declarations)
         return json.dumps(declarations, indent=indent, ensure_ascii=False)
 
+    def _needs_cleaning(self, schema: Dict[str, Any]) -> bool:
+        """Check whether _clean_parameters would change the schema.
+
+        Walks the schema with an explicit stack and stops at the first node
+        that is not already AI Studio compliant: a non-whitelisted key, a type
+        that is not a normalized string, a non-bool nullable, or
+        properties/items that are not dicts.
+
+        Args:
+            schema: JSON Schema dict to inspect.
+
+        Returns:
+            False if the schema can be used unchanged, True otherwise.
+        """
+        allowed = self.ALLOWED_SCHEMA_FIELDS
+        stack: List[Any] = [schema]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                # _clean_parameters returns non-dict nodes unchanged
+                continue
+            for key, value in node.items():
+                if key not in allowed:
+                    return True
+                if key == "type":
+                    if (
+                        not isinstance(value, str)
+                        or self._normalize_type(value) != value
+                    ):
+                        return True
+                elif key == "properties":
+                    if not isinstance(value, dict):
+                        return True
+                    stack.extend(value.values())
+                elif key == "items":
+                    if not isinstance(value, dict):
+                        return True
+                    stack.append(value)
+                elif key == "nullable" and value is not True and value is not False:
+                    return True
+        return False
+
     def _clean_parameters(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Convert OpenAI/JSON Schema to Gemini-compatible format.
 
@@ -747,15 +877,76 @@ class SchemaConverter:
         - Type normalization (list to single type + nullable)
         - Conversion: const -> enum, oneOf/allOf -> anyOf (simplified)
         - Whitelist-based field filtering
-        - Recursive cleaning of nested schemas
+        - Cleaning of nested schemas
+
+        Nested schemas are cleaned with an explicit stack in post-order (every
+        sub-schema before the schema containing it), so deep schemas cost no
+        Python call frames and cannot hit the recursion limit.
+
+        Raises:
+            SchemaConversionError: If the schema contains a reference cycle.
         """
         if not isinstance(schema, dict):
             return schema
 
+        results: Dict[int, Dict[str, Any]] = {}
+        entered: set = set()
+        stack: List[Tuple[Dict[str, Any], bool]] = [(schema, False)]
+        while stack:
+            node, children_done = stack.pop()
+            node_id = id(node)
+            if children_done:
+                results[node_id] = self._clean_node(node, results)
+                continue
+            if node_id in results:
+                continue
+            if node_id in entered:
+                raise SchemaConversionError("Schema contains a reference cycle")
+            entered.add(node_id)
+            stack.append((node, True))
+            stack.extend((child, False) for child in self._sub_schemas(node))
+
+        return results[id(schema)]
+
+    @staticmethod
+    def _sub_schemas(schema: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """List the nested schemas _clean_node may need cleaned results for."""
+        children: List[Dict[str, Any]] = []
+
+        for logic_field in SchemaConverter.LOGIC_FIELDS:
+            val = schema.get(logic_field)
+            if isinstance(val, list):
+                for option in val:
+                    if isinstance(option, dict) and option.get("type") != "null":
+                        children.append(option)
+                        break
+
+        properties = schema.get("properties")
+        if isinstance(properties, dict):
+            children.extend(p for p in properties.values() if isinstance(p, dict))
+
+        items = schema.get("items")
+        if isinstance(items, dict):
+            children.append(items)
+
+        return children
+
+    def _clean_node(
+        self, schema: Dict[str, Any], results: Dict[int, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Clean a single schema node whose sub-schemas are already cleaned.
+
+        Args:
+            schema: The schema node to clean.
+            results: Cleaned sub-schemas keyed by id() of the original dict.
+
+        Returns:
+            The cleaned schema node.
+        """
         cleaned: Dict[str, Any] = {}
 
         # 1. Handle anyOf/oneOf/allOf: AI Studio doesn't support these, extract first non-null type
-        for logic_field in ["anyOf", "oneOf", "allOf"]:
+        for logic_field in self.LOGIC_FIELDS:
             if logic_field in schema:
                 val = schema[logic_field]
                 if isinstance(val, list) and len(val) > 0:
@@ -765,8 +956,7 @@ class SchemaConverter:
                             option_type = option.get("type")
                             if option_type != "null":
                                 # Merge the first valid option into cleaned
-                                merged = self._clean_parameters(option)
-                                cleaned.update(merged)
+                                cleaned.update(results[id(option)])
                                 break
                     # Check if null was an option for nullable
                     for option in val:
@@ -800,21 +990,26 @@ class SchemaConverter:
             if isinstance(raw_type, str):
                 cleaned["type"] = self._normalize_type(raw_type)
 
-        # 4. Handle properties recursively (must do before the loop)
+        # 4. Handle properties (must do before the loop).
+        # Dict sub-schemas were cleaned already; leaves are kept as-is.
         if "properties" in schema and isinstance(schema["properties"], dict):
             cleaned["properties"] = {
-                prop_name: self._clean_parameters(prop_schema)
+                prop_name: results[id(prop_schema)]
+                if isinstance(prop_schema, dict)
+                else prop_schema
                 for prop_name, prop_schema in schema["properties"].items()
             }
 
-        # 5. Handle items recursively (for arrays)
+        # 5. Handle items (for arrays)
         if "items" in schema and isinstance(schema["items"], dict):
-            cleaned["items"] = self._clean_parameters(schema["items"])
+            cleaned["items"] = results[id(schema["items"])]
 
         # 6. Copy ONLY allowed fields (whitelist approach)
+        special_fields = self.SPECIAL_FIELDS
+        allowed_fields = self.ALLOWED_SCHEMA_FIELDS
         for key, value in schema.items():
             # Skip fields we already handled
-            if key in self.SPECIAL_FIELDS:
+            if key in special_fields:
                 continue
 
             # Skip nullable if already set from type array
@@ -822,7 +1017,7 @@ class SchemaConverter:
                 continue
 
             # Only copy fields that Gemini accepts
-            if key not in self.ALLOWED_SCHEMA_FIELDS:
+            if key not in allowed_fields:
                 continue
 
             # Copy allowed fields as-is (properties/items already handled above)
@@ -832,26 +1027,35 @@ class SchemaConverter:
         return cleaned
 
 
+# Maximum number of memoized tool conversions
+CONVERSION_CACHE_SIZE = 256
+
+# LRU of converted declarations keyed by (converter class, tool JSON,
+# FUNCTION_CALLING_UPPERCASE_TYPES)
+_conversion_cache: "OrderedDict[Tuple[type, str, bool], Dict[str, Any]]" = OrderedDict()
+
+
 # =============================================================================
 # Call ID Manager
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PendingCall:
     """Represents a pending function call awaiting result.
 
     Attributes:
-        call_id: Unique identifier for this call (call_<uuid>).
+        call_id: Unique identifier for this call (call_<24-character-hex>).
         function_name: Name of the function being called.
         arguments: Arguments passed to the function.
-        timestamp: Unix timestamp when the call was registered.
+        timestamp: time.monotonic() value when the call was registered, for
+            measuring how long the call has been pending.
     """
 
     call_id: str
     function_name: str
     arguments: Dict[str, Any]
-    timestamp: float = field(default_factory=lambda: __import__("time").time())
+    timestamp: float = field(default_factory=time.monotonic)
 
 
 class CallIdManager:
@@ -862,16 +1066,22 @@ class CallIdManager:
 
     ID Format: call_<24-character-hex>
     Example: call_a1b2c3d4e5f6789012345678
+
+    Pending calls are bounded: clients that never send tool results would
+    otherwise grow the registry forever, so the oldest entries are evicted
+    once MAX_PENDING_CALLS is exceeded.
     """
 
     # Prefix for all generated call IDs
     CALL_ID_PREFIX = "call_"
     # Length of the hex portion of the ID
     HEX_LENGTH = 24
+    # Maximum number of tracked pending calls before oldest are evicted
+    MAX_PENDING_CALLS = 10000
 
     def __init__(self) -> None:
         """Initialize the call ID manager."""
-        self._pending_calls: Dict[str, PendingCall] = {}
+        self._pending_calls: "OrderedDict[str, PendingCall]" = OrderedDict()
 
     def generate_id(self) -> str:
         """Generate a unique call ID.
@@ -879,7 +1089,8 @@ class CallIdManager:
         Returns:
             A unique call ID in format: call_<24-character-hex>
         """
-        hex_part = uuid.uuid4().hex[: self.HEX_LENGTH]
+        # token_hex(n) yields 2n hex chars straight from the OS CSPRNG
+        hex_part = secrets.token_hex(self.HEX_LENGTH // 2)
         return f"{self.CALL_ID_PREFIX}{hex_part}"
 
     def register_call(
@@ -898,12 +1109,22 @@ class CallIdManager:
         Returns:
             The registered PendingCall object.
         """
+        # Function names repeat across calls; share one string object.
+        # sys.intern only accepts exact str, so leave anything else as-is.
+        if type(function_name) is str:
+            function_name = sys.intern(function_name)
         pending = PendingCall(
             call_id=call_id,
             function_name=function_name,
             arguments=arguments,
         )
-        self._pending_calls[call_id] = pending
+        pending_calls = self._pending_calls
+        pending_calls[call_id] = pending
+        pending_calls.move_to_end(call_id)
+        while len(pending_calls) > self.MAX_PENDING_CALLS:
+            evicted_id, _ = pending_calls.popitem(last=False)
+            if FUNCTION_CALLING_DEBUG:
+                logger.debug(f"Evicted oldest pending call: {evicted_id}")
         if FUNCTION_CALLING_DEBUG:
             logger.debug(f"Registered pending call: {call_id} -> {function_name}")
         return pending
@@ -948,7 +1169,7 @@ class CallIdManager:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFunctionCall:
     """Represents a parsed function call from Gemini's response.
 
@@ -968,22 +1189,37 @@ class ParsedFunctionCall:
 # =============================================================================
 
 
-class OpenAIFunctionCall(BaseModel):
+@dataclass(slots=True, frozen=True)
+class OpenAIFunctionCall:
     """OpenAI function call structure within a tool call."""
 
     name: str
     arguments: str  # JSON string, NOT dict
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the OpenAI wire format."""
+        return {"name": self.name, "arguments": self.arguments}
+
+
+@dataclass(slots=True, frozen=True)
+class OpenAIToolCall:
+    """OpenAI tool_calls array item structure.
 
-class OpenAIToolCall(BaseModel):
-    """OpenAI tool_calls array item structure."""
+    Documents the schema produced by ResponseFormatter.format_tool_call, which
+    builds the dict directly instead of instantiating this class.
+    """
 
     id: str
-    type: str = "function"
     function: OpenAIFunctionCall
+    type: str = "function"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the OpenAI wire format."""
+        return {"id": self.id, "type": self.type, "function": self.function.to_dict()}
 
 
-class OpenAIToolCallDelta(BaseModel):
+@dataclass(slots=True, frozen=True)
+class OpenAIToolCallDelta:
     """OpenAI streaming delta for tool calls."""
 
     index: int
@@ -991,6 +1227,17 @@ class OpenAIToolCallDelta(BaseModel):
     type: Optional[str] = None  # Only on first chunk
     function: Optional[Dict[str, Any]] = None  # Contains name and/or arguments
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the OpenAI wire format, omitting unset fields."""
+        delta: Dict[str, Any] = {"index": self.index}
+        if self.id is not None:
+            delta["id"] = self.id
+        if self.type is not None:
+            delta["type"] = self.type
+        if self.function is not None:
+            delta["function"] = self.function
+        return delta
+
 
 class ResponseFormatter:
     """Formats parsed function calls to OpenAI's tool_calls structure.
@@ -1065,18 +1312,18 @@ class ResponseFormatter:
         )
 
         # Arguments must be a JSON string per OpenAI spec
-        arguments_str = json.dumps(parsed_call.arguments, ensure_ascii=False)
-
-        tool_call = OpenAIToolCall(
-            id=call_id,
-            type="function",
-            function=OpenAIFunctionCall(
-                name=parsed_call.name,
-                arguments=arguments_str,
-            ),
-        )
+        arguments_str = _dumps(parsed_call.arguments)
 
-        return tool_call.model_dump()
+        # Build the dict directly - same shape as OpenAIToolCall.model_dump(),
+        # without paying for model validation on every call
+        return {
+            "id": call_id,
+            "type": "function",
+            "function": {
+                "name": parsed_call.name,
+                "arguments": arguments_str,
+            },
+        }
 
     def format_tool_calls(
         self,
@@ -1096,7 +1343,7 @@ class ResponseFormatter:
                 FCModule.RESPONSE,
                 f"Formatting {len(parsed_calls)} tool call(s) for OpenAI response",
             )
-        return [self.format_tool_call(call) for call in parsed_calls]
+        return list(map(self.format_tool_call, parsed_calls))
 
     def format_tool_call_delta(
         self,
@@ -1172,12 +1419,35 @@ class ResponseFormatter:
             arguments=parsed_call.arguments,
         )
 
-        return self.format_tool_call_delta(
-            index=index,
-            call_id=call_id,
-            function_name=parsed_call.name,
-            arguments_fragment="",
-        )
+        return self._first_delta(index, call_id, parsed_call.name)
+
+    @staticmethod
+    def _first_delta(index: int, call_id: str, function_name: str) -> Dict[str, Any]:
+        """Build the metadata delta that opens a streamed tool call.
+
+        Equivalent to format_tool_call_delta(index, call_id, function_name)
+        without its per-field branching.
+        """
+        return {
+            "index": index,
+            "id": call_id,
+            "type": "function",
+            "function": {"name": function_name},
+        }
+
+    @staticmethod
+    def _arg_delta(index: int, call_id: str, fragment: str) -> Dict[str, Any]:
+        """Build an arguments delta for a streamed tool call.
+
+        Equivalent to format_tool_call_delta(index, call_id,
+        arguments_fragment=fragment) for a non-empty fragment.
+        """
+        return {
+            "index": index,
+            "id": call_id,
+            "type": "function",
+            "function": {"arguments": fragment},
+        }
 
     def format_streaming_chunks(
         self,
@@ -1206,33 +1476,80 @@ class ResponseFormatter:
             arguments=parsed_call.arguments,
         )
 
-        chunks: List[Dict[str, Any]] = []
-
         # First chunk with metadata
-        chunks.append(
-            self.format_tool_call_delta(
-                index=index,
-                call_id=call_id,
-                function_name=parsed_call.name,
-                arguments_fragment="",
-            )
+        chunks: List[Dict[str, Any]] = [
+            self._first_delta(index, call_id, parsed_call.name)
+        ]
+
+        # Arguments chunks (ID included in all chunks for consistency).
+        # Slicing the str keeps multi-byte characters intact, which byte-level
+        # chunking of the UTF-8 encoding would not.
+        arg_delta = self._arg_delta
+        arguments_str = _dumps(parsed_call.arguments)
+        chunks.extend(
+            [
+                arg_delta(index, call_id, arguments_str[i : i + chunk_size])
+                for i in range(0, len(arguments_str), chunk_size)
+            ]
         )
 
-        # Arguments chunks
-        arguments_str = json.dumps(parsed_call.arguments, ensure_ascii=False)
-        for i in range(0, len(arguments_str), chunk_size):
-            fragment = arguments_str[i : i + chunk_size]
-            chunks.append(
-                self.format_tool_call_delta(
-                    index=index,
-                    call_id=call_id,  # Include ID in all chunks for consistency
-                    arguments_fragment=fragment,
-                )
-            )
+        return chunks
+
+    def format_streaming_chunks_json(
+        self,
+        index: int,
+        parsed_call: ParsedFunctionCall,
+        chunk_size: int = 50,
+    ) -> List[str]:
+        """Format streaming chunks as pre-serialized compact JSON strings.
+
+        Produces exactly json.dumps(chunk, ensure_ascii=False,
+        separators=(",", ":")) for each chunk of format_streaming_chunks, but
+        fills string templates instead of building a dict per chunk that the
+        SSE layer would immediately serialize again.
+
+        Args:
+            index: The index of this tool call.
+            parsed_call: The parsed function call.
+            chunk_size: Size of each arguments chunk.
+
+        Returns:
+            List of JSON-encoded delta chunks for streaming.
+        """
+        call_id = self._id_manager.generate_id()
+
+        # Register for tracking
+        self._id_manager.register_call(
+            call_id=call_id,
+            function_name=parsed_call.name,
+            arguments=parsed_call.arguments,
+        )
+
+        encode = _compact_encoder
+        id_json = encode(call_id)
+        chunks: List[str] = [
+            _FIRST_DELTA_TEMPLATE % (index, id_json, encode(parsed_call.name))
+        ]
+
+        arguments_str = _dumps(parsed_call.arguments)
+        chunks.extend(
+            [
+                _ARG_DELTA_TEMPLATE
+                % (index, id_json, encode(arguments_str[i : i + chunk_size]))
+                for i in range(0, len(arguments_str), chunk_size)
+            ]
+        )
 
         return chunks
 
 
+# Compact JSON templates matching _first_delta / _arg_delta key order
+_FIRST_DELTA_TEMPLATE = '{"index":%d,"id":%s,"type":"function","function":{"name":%s}}'
+_ARG_DELTA_TEMPLATE = (
+    '{"index":%d,"id":%s,"type":"function","function":{"arguments":%s}}'
+)
+
+
 # =============================================================================
 # Message Builder Helper
 # =============================================================================
@@ -12,7 +12,7 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 from browser_utils.page_controller import PageController
 from logging_utils.fc_debug import FCModule, get_fc_logger
@@ -664,10 +664,50 @@ class FunctionCallingOrchestrator:
         Returns:
             List of delta objects for streaming.
         """
+        all_chunks: List[Dict[str, Any]] = []
+        for idx, parsed in self._iter_streamable_calls(functions):
+            chunks = self._response_formatter.format_streaming_chunks(
+                index=idx, parsed_call=parsed, chunk_size=chunk_size
+            )
+            all_chunks.extend(chunks)
+
+        return all_chunks
+
+    def format_streaming_tool_calls_json(
+        self,
+        functions: List[Dict[str, Any]],
+        chunk_size: int = 50,
+    ) -> List[str]:
+        """Format function calls for streaming as pre-serialized JSON deltas.
+
+        Same chunks as format_streaming_tool_calls, already encoded as compact
+        JSON so the SSE layer can splice them into its envelope.
+
+        Args:
+            functions: List of function call data.
+            chunk_size: Size of each arguments chunk.
+
+        Returns:
+            List of JSON-encoded delta objects for streaming.
+        """
+        all_chunks: List[str] = []
+        for idx, parsed in self._iter_streamable_calls(functions):
+            all_chunks.extend(
+                self._response_formatter.format_streaming_chunks_json(
+                    index=idx, parsed_call=parsed, chunk_size=chunk_size
+                )
+            )
+
+        return all_chunks
+
+    @staticmethod
+    def _iter_streamable_calls(
+        functions: List[Dict[str, Any]],
+    ) -> Iterator[Tuple[int, ParsedFunctionCall]]:
+        """Yield (index, parsed call) for each valid function call entry."""
         if not functions:
-            return []
+            return
 
-        all_chunks: List[Dict[str, Any]] = []
         for idx, func_data in enumerate(functions):
             if not isinstance(func_data, dict):
                 continue
@@ -678,13 +718,7 @@ class FunctionCallingOrchestrator:
             if not name:
                 continue
 
-            parsed = ParsedFunctionCall(name=name, arguments=params)
-            chunks = self._response_formatter.format_streaming_chunks(
-                index=idx, parsed_call=parsed, chunk_size=chunk_size
-            )
-            all_chunks.extend(chunks)
-
-        return all_chunks
+            yield idx, ParsedFunctionCall(name=name, arguments=params)
 
 
 # Module-level singleton for convenience
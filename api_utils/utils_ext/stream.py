@@ -3,15 +3,222 @@ import json
 import queue
 import re
 import time
+from dataclasses import dataclass
 from typing import Any, AsyncGenerator, Callable, List, Optional, Tuple
 
+from api_utils.server_state import state
+from config import (
+    CHAT_SESSION_CONTENT_SELECTOR,
+    LAST_CHAT_TURN_SELECTOR,
+    SCROLL_CONTAINER_SELECTOR,
+    SUBMIT_BUTTON_SELECTOR,
+    UI_GENERATION_WAIT_TIMEOUT_MS,
+    get_boolean_env,
+)
+from config.global_state import GlobalState
 from config.settings import FUNCTION_CALLING_DEBUG
 from logging_utils import set_request_id
+from models import (
+    ClientDisconnectedError,
+    ForbiddenRetry,
+    QuotaExceededError,
+    UpstreamError,
+)
 
-# [REFAC-01] Structural Boundary Pattern
+# [REFAC-01] Structural Boundary Pattern (ASCII classes only, so re.ASCII)
 TOOL_STRUCTURE_PATTERN = re.compile(
-    r"(?:^|\n)\s*(?:```[a-zA-Z0-9]*\s*)?<[a-zA-Z0-9_\-]+(?:\s|>)"
+    r"(?:^|\n)\s*(?:```[a-zA-Z0-9]*\s*)?<[a-zA-Z0-9_\-]+(?:\s|>)", re.ASCII
 )
+# Opening tag alone; the line-start part of the pattern is checked by hand
+_TAG_OPEN_PATTERN = re.compile(r"<[a-zA-Z0-9_\-]+[\s>]", re.ASCII)
+_ASCII_WHITESPACE = frozenset(" \t\n\r\f\v")
+_ASCII_ALNUM = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+)
+
+# Installed once per stream; keeps the latest turn in view so AI Studio keeps
+# rendering. Later ticks only send the short call expression below.
+_SCROLL_INSTALL_JS = """() => {
+    window.__forceScroll = (scrollSel, contentSel, lastTurnSel) => {
+        const scrollContainer = document.querySelector(scrollSel);
+        if (scrollContainer) scrollContainer.scrollTop = scrollContainer.scrollHeight;
+        const sessionContent = document.querySelector(contentSel);
+        if (sessionContent) sessionContent.scrollTop = sessionContent.scrollHeight;
+        const lastTurn = document.querySelector(lastTurnSel);
+        if (lastTurn) lastTurn.scrollIntoView({behavior: "instant", block: "end"});
+        window.scrollTo(0, document.body.scrollHeight);
+        return true;
+    };
+}"""
+_SCROLL_CALL_JS = (
+    "(a) => window.__forceScroll ? window.__forceScroll(a[0], a[1], a[2]) : false"
+)
+# While the queue is idle, only scroll every N wait ticks (~0.1s each)
+_IDLE_SCROLL_INTERVAL_TICKS = 5
+# Length of one empty-queue wait tick; all wait limits are counted in ticks
+_QUEUE_WAIT_TICK = 0.1
+# Packets consumed back to back before the per-pass checks run again
+_MAX_BURST_PACKETS = 16
+# Items drained by clear_stream_queue before yielding to the event loop
+_CLEAR_YIELD_INTERVAL = 256
+# Seconds a UI generation probe result is reused before probing the page again
+_UI_PROBE_TTL = 2.0
+
+
+@dataclass(slots=True)
+class StreamState:
+    """Accumulated reason/body text and tool-boundary split state of one stream."""
+
+    acc_reason_state: str = ""
+    acc_body_state: str = ""
+    boundary_buffer: str = ""
+    force_body_mode: bool = False
+    split_index: int = -1
+    # Reason text before split_index; the accumulator only ever grows at the
+    # end, so this prefix is fixed once the split happens.
+    thought_part: str = ""
+
+
+def _line_start_before(text: str, end: int) -> int:
+    """Return where a ``(?:^|\\n)\\s*`` prefix ending at `end` starts, or -1."""
+    i = end
+    while i > 0 and text[i - 1] in _ASCII_WHITESPACE:
+        i -= 1
+    if i == 0:
+        return 0
+    return text.find("\n", i, end)
+
+
+def find_tool_structure(text: str) -> int:
+    """Return the start of the first TOOL_STRUCTURE_PATTERN match, or -1.
+
+    Equivalent to ``TOOL_STRUCTURE_PATTERN.search(text).start()``, but only
+    opening tags are located by regex; the leading line start, whitespace and
+    optional code fence are verified by walking backwards from each tag. This
+    avoids the pattern's backtracking over long whitespace runs.
+
+    Args:
+        text: Text to scan.
+
+    Returns:
+        Match start index, or -1 if there is no tool structure.
+    """
+    for tag in _TAG_OPEN_PATTERN.finditer(text):
+        pos = tag.start()
+        # Optional ```lang fence right before the whitespace preceding the tag
+        fence_end = pos
+        while fence_end > 0 and text[fence_end - 1] in _ASCII_WHITESPACE:
+            fence_end -= 1
+        while fence_end > 0 and text[fence_end - 1] in _ASCII_ALNUM:
+            fence_end -= 1
+        if fence_end >= 3 and text[fence_end - 3 : fence_end] == "```":
+            start = _line_start_before(text, fence_end - 3)
+            if start != -1:
+                return start
+        start = _line_start_before(text, pos)
+        if start != -1:
+            return start
+    return -1
+
+
+def _apply_boundary(
+    p_reason: str, p_body: str, stream_state: StreamState
+) -> Tuple[str, str, bool]:
+    """Accumulate one packet and split reason text at the first tool structure.
+
+    Packets may carry either cumulative text or deltas; both are folded into
+    the accumulators. Once a tool structure is found in the reason stream,
+    everything from that point on is routed to the body.
+
+    Args:
+        p_reason: Reason text of the packet.
+        p_body: Body text of the packet.
+        stream_state: Per-stream state, updated in place.
+
+    Returns:
+        Tuple of (reason, body, split_applied) where split_applied is True
+        only for the packet that triggered the boundary split.
+    """
+    acc_reason = stream_state.acc_reason_state
+    if p_reason and acc_reason and p_reason.startswith(acc_reason):
+        new_reason_delta = p_reason[len(acc_reason) :]
+        acc_reason = p_reason
+    else:
+        acc_reason += p_reason
+        new_reason_delta = p_reason
+    stream_state.acc_reason_state = acc_reason
+
+    acc_body = stream_state.acc_body_state
+    if p_body and acc_body and p_body.startswith(acc_body):
+        acc_body = p_body
+    else:
+        acc_body += p_body
+    stream_state.acc_body_state = acc_body
+
+    if stream_state.force_body_mode:
+        overflow = acc_reason[stream_state.split_index :]
+        return stream_state.thought_part, acc_body + overflow, False
+
+    text_to_check = stream_state.boundary_buffer + new_reason_delta
+    # Every tool structure contains "<"; most packets have none, so skip the scan
+    start = find_tool_structure(text_to_check) if "<" in text_to_check else -1
+    if start != -1:
+        split_index = len(acc_reason) - len(text_to_check) + start
+        stream_state.split_index = split_index
+        stream_state.force_body_mode = True
+        stream_state.thought_part = acc_reason[:split_index]
+        return stream_state.thought_part, acc_body + acc_reason[split_index:], True
+
+    stream_state.boundary_buffer = text_to_check[-100:]
+    return acc_reason, acc_body, False
+
+
+def _queue_reader_fd(stream_queue: Any) -> Optional[int]:
+    """Return the pipe fd a multiprocessing.Queue receives on, if available."""
+    try:
+        fd = stream_queue._reader.fileno()
+    except Exception:
+        return None
+    return fd if isinstance(fd, int) else None
+
+
+def _set_ready(future: "asyncio.Future[bool]", readable: bool) -> None:
+    """Reader/timer callback: resolve the wait future with the first outcome."""
+    if not future.done():
+        future.set_result(readable)
+
+
+async def _wait_for_queue_data(fd: Optional[int], timeout: float) -> bool:
+    """Wait until the queue pipe becomes readable or the timeout elapses.
+
+    Falls back to a plain sleep when there is no fd or the event loop cannot
+    watch file descriptors (e.g. the Windows proactor loop).
+
+    Args:
+        fd: Reader fd from _queue_reader_fd, or None.
+        timeout: Maximum time to wait in seconds.
+
+    Returns:
+        True if woken by incoming data, False on timeout or fallback sleep.
+    """
+    if fd is None:
+        await asyncio.sleep(timeout)
+        return False
+    loop = asyncio.get_running_loop()
+    outcome: "asyncio.Future[bool]" = loop.create_future()
+    try:
+        loop.add_reader(fd, _set_ready, outcome, True)
+    except (NotImplementedError, OSError, ValueError):
+        await asyncio.sleep(timeout)
+        return False
+    # A plain timer handle instead of asyncio.wait_for: no extra waiter future
+    # or task per tick, which matters at ~10 ticks per second.
+    timer = loop.call_later(timeout, _set_ready, outcome, False)
+    try:
+        return await outcome
+    finally:
+        timer.cancel()
+        loop.remove_reader(fd)
 
 
 async def use_stream_response(
@@ -24,25 +231,8 @@ async def use_stream_response(
     enable_silence_detection: bool = True,
 ) -> AsyncGenerator[Any, None]:
     """Enhanced stream response handler with UI-based generation active checks."""
-    from api_utils.server_state import state
-
     STREAM_QUEUE = state.STREAM_QUEUE
     logger = state.logger
-    from browser_utils.page_controller import PageController
-    from config import (
-        CHAT_SESSION_CONTENT_SELECTOR,
-        LAST_CHAT_TURN_SELECTOR,
-        SCROLL_CONTAINER_SELECTOR,
-        UI_GENERATION_WAIT_TIMEOUT_MS,
-        get_boolean_env,
-    )
-    from config.global_state import GlobalState
-    from models import (
-        ClientDisconnectedError,
-        ForbiddenRetry,
-        QuotaExceededError,
-        UpstreamError,
-    )
 
     set_request_id(req_id)
     if STREAM_QUEUE is None:
@@ -52,17 +242,12 @@ async def use_stream_response(
     if stream_start_time == 0.0:
         stream_start_time = time.time() - 10.0
 
-    accumulated_body = ""
+    accumulated_body_len = 0
     accumulated_reason_len = 0
     total_reason_processed = 0
     total_body_processed = 0
     boundary_transitions = 0
-    boundary_buffer = ""
-
-    acc_reason_state = ""
-    acc_body_state = ""
-    force_body_mode = False
-    split_index = -1
+    stream_state = StreamState()
     empty_count = 0
     initial_wait_limit = int(timeout * 10)
     silence_wait_limit = int(silence_threshold * 10)
@@ -75,26 +260,55 @@ async def use_stream_response(
     received_items_count = 0
     stale_done_ignored = False
     last_ui_check_time = 0
+    # Result of the latest periodic UI probe; None until the first probe
+    ui_generation_active: Optional[bool] = None
     ui_check_interval = int(UI_GENERATION_WAIT_TIMEOUT_MS / 100)
     if ui_check_interval <= 0:
         ui_check_interval = 1
 
-    last_packet_time = time.time()
+    # Elapsed-time checks use the monotonic clock; stream_start_time and the
+    # packet "ts" stamps stay wall-clock because they come from other processes
+    last_packet_time = time.monotonic()
     min_items_before_silence_check = 10
 
+    queue_fd = _queue_reader_fd(STREAM_QUEUE)
+    queue_signalled = False
+    burst_count = 0
+    scroll_installed = False
+    scroll_tick = 0
+    scroll_selectors = [
+        SCROLL_CONTAINER_SELECTOR,
+        CHAT_SESSION_CONTENT_SELECTOR,
+        LAST_CHAT_TURN_SELECTOR,
+    ]
+
+    # Locators are lazy queries, so they can be built once and re-evaluated
+    stop_button = submit_button = None
+    if page:
+        stop_button = page.locator('button[aria-label="Stop generating"]')
+        submit_button = page.locator(SUBMIT_BUTTON_SELECTOR)
+
+    ui_probe_time = float("-inf")
+    ui_probe_result = False
+
     async def check_ui_generation_active():
-        if not page:
+        nonlocal ui_probe_time, ui_probe_result
+        if stop_button is None or submit_button is None:
             return False
+        now = time.monotonic()
+        if now - ui_probe_time < _UI_PROBE_TTL:
+            return ui_probe_result
+        ui_probe_result = await probe_ui_generation_active(stop_button, submit_button)
+        ui_probe_time = now
+        return ui_probe_result
+
+    async def probe_ui_generation_active(stop_locator, submit_locator):
         try:
-            stop_button = page.locator('button[aria-label="Stop generating"]')
-            if await stop_button.is_visible(timeout=1000):
+            if await stop_locator.is_visible(timeout=1000):
                 return True
-            from config.selectors import SUBMIT_BUTTON_SELECTOR
-
-            submit_button = page.locator(SUBMIT_BUTTON_SELECTOR)
-            if await submit_button.count() > 0:
+            if await submit_locator.count() > 0:
                 try:
-                    if await submit_button.first.is_disabled(timeout=2000):
+                    if await submit_locator.first.is_disabled(timeout=2000):
                         return True
                 except Exception:
                     return False
@@ -102,71 +316,67 @@ async def use_stream_response(
         except Exception:
             return False
 
+    # The shutdown event is created once at import; bind its check for the loop
+    is_shutting_down = GlobalState.IS_SHUTTING_DOWN.is_set
+
     try:
         while True:
-            if (
-                GlobalState.CURRENT_STREAM_REQ_ID
-                and GlobalState.CURRENT_STREAM_REQ_ID != req_id
-            ):
-                logger.warning(f"[{req_id}] Zombie Stream detected. Terminating.")
-                yield {
-                    "done": True,
-                    "reason": "zombie_stream_aborted",
-                    "body": "",
-                    "function": [],
-                }
-                return
-
-            if page:
-                try:
-                    await page.evaluate(
-                        """([scrollSel, contentSel, lastTurnSel]) => {
-                        const scrollContainer = document.querySelector(scrollSel);
-                        if (scrollContainer) scrollContainer.scrollTop = scrollContainer.scrollHeight;
-                        const sessionContent = document.querySelector(contentSel);
-                        if (sessionContent) sessionContent.scrollTop = sessionContent.scrollHeight;
-                        const lastTurn = document.querySelector(lastTurnSel);
-                        if (lastTurn) lastTurn.scrollIntoView({behavior: "instant", block: "end"});
-                        window.scrollTo(0, document.body.scrollHeight);
-                    }""",
-                        [
-                            SCROLL_CONTAINER_SELECTOR,
-                            CHAT_SESSION_CONTENT_SELECTOR,
-                            LAST_CHAT_TURN_SELECTOR,
-                        ],
-                    )
-                except Exception:
-                    pass
+            # Per-pass checks run once per burst of queued packets
+            if burst_count == 0:
+                if (
+                    GlobalState.CURRENT_STREAM_REQ_ID
+                    and GlobalState.CURRENT_STREAM_REQ_ID != req_id
+                ):
+                    logger.warning(f"[{req_id}] Zombie Stream detected. Terminating.")
+                    yield {
+                        "done": True,
+                        "reason": "zombie_stream_aborted",
+                        "body": "",
+                        "function": [],
+                    }
+                    return
 
-            if GlobalState.IS_QUOTA_EXCEEDED and not GlobalState.IS_RECOVERING:
-                logger.warning(f"[{req_id}] Quota detected. Pausing...")
-                try:
-                    start_wait = time.time()
-                    while time.time() - start_wait < 2.0:
-                        if GlobalState.IS_RECOVERING:
-                            break
-                        await asyncio.sleep(0.2)
-                except Exception:
-                    pass
+                if page and scroll_tick % _IDLE_SCROLL_INTERVAL_TICKS == 0:
+                    try:
+                        if not scroll_installed:
+                            await page.evaluate(_SCROLL_INSTALL_JS)
+                            scroll_installed = True
+                        if not await page.evaluate(_SCROLL_CALL_JS, scroll_selectors):
+                            # Page was reloaded or navigated; reinstall next tick
+                            scroll_installed = False
+                    except Exception:
+                        pass
+                scroll_tick += 1
 
-                if GlobalState.IS_RECOVERING:
-                    logger.info(f"[{req_id}] 🔄 Recovery mode detected. Holding...")
-                elif not GlobalState.IS_QUOTA_EXCEEDED:
-                    logger.info(f"[{req_id}] ✅ Recovery completed. Resuming...")
-                else:
-                    logger.warning(f"[{req_id}] ⛔ Quota exceeded, waiting...")
-                    await asyncio.sleep(1.0)
-                    continue
-
-            if GlobalState.IS_SHUTTING_DOWN.is_set():
-                logger.warning(f"[{req_id}] 🛑 Global Shutdown. Aborting.")
-                yield {
-                    "done": True,
-                    "reason": "global_shutdown",
-                    "body": "",
-                    "function": [],
-                }
-                return
+                if GlobalState.IS_QUOTA_EXCEEDED and not GlobalState.IS_RECOVERING:
+                    logger.warning(f"[{req_id}] Quota detected. Pausing...")
+                    try:
+                        start_wait = time.monotonic()
+                        while time.monotonic() - start_wait < 2.0:
+                            if GlobalState.IS_RECOVERING:
+                                break
+                            await asyncio.sleep(0.2)
+                    except Exception:
+                        pass
+
+                    if GlobalState.IS_RECOVERING:
+                        logger.info(f"[{req_id}] 🔄 Recovery mode detected. Holding...")
+                    elif not GlobalState.IS_QUOTA_EXCEEDED:
+                        logger.info(f"[{req_id}] ✅ Recovery completed. Resuming...")
+                    else:
+                        logger.warning(f"[{req_id}] ⛔ Quota exceeded, waiting...")
+                        await asyncio.sleep(1.0)
+                        continue
+
+                if is_shutting_down():
+                    logger.warning(f"[{req_id}] 🛑 Global Shutdown. Aborting.")
+                    yield {
+                        "done": True,
+                        "reason": "global_shutdown",
+                        "body": "",
+                        "function": [],
+                    }
+                    return
 
             try:
                 data = STREAM_QUEUE.get_nowait()
@@ -174,33 +384,40 @@ async def use_stream_response(
                     logger.info(f"[{req_id}] 🔴 Received termination signal.")
                     break
 
-                if isinstance(data, dict) and data.get("done") is True:
+                if (
+                    isinstance(data, dict)
+                    and data.get("done") is True
+                    and not data.get("error")
+                ):
                     logger.info(f"[{req_id}] ✅ Explicit DONE received.")
                     yield data
                     break
 
                 empty_count = 0
+                ui_generation_active = None
+                queue_signalled = False
+                scroll_tick = 0
+                burst_count = (burst_count + 1) % _MAX_BURST_PACKETS
                 _data_received = True
                 received_items_count += 1
-                last_packet_time = time.time()
+                last_packet_time = time.monotonic()
 
+                # The proxy enqueues dicts; JSON strings are still accepted
                 actual_data = data
                 if isinstance(data, str):
                     try:
-                        parsed_wrapper = json.loads(data)
-                        if (
-                            isinstance(parsed_wrapper, dict)
-                            and "ts" in parsed_wrapper
-                            and "data" in parsed_wrapper
-                        ):
-                            if parsed_wrapper["ts"] < stream_start_time:
-                                logger.warning(f"[{req_id}] 🗑️ Stale data ignored.")
-                                continue
-                            actual_data = parsed_wrapper["data"]
-                        else:
-                            actual_data = parsed_wrapper
+                        actual_data = json.loads(data)
                     except json.JSONDecodeError:
                         pass
+                if (
+                    isinstance(actual_data, dict)
+                    and "ts" in actual_data
+                    and "data" in actual_data
+                ):
+                    if actual_data["ts"] < stream_start_time:
+                        logger.warning(f"[{req_id}] 🗑️ Stale data ignored.")
+                        continue
+                    actual_data = actual_data["data"]
 
                 if isinstance(actual_data, dict):
                     if actual_data.get("error"):
@@ -220,9 +437,7 @@ async def use_stream_response(
                                 f"AI Studio quota exceeded: {message}", req_id=req_id
                             )
                         if is_forbidden and get_boolean_env("RETRY_ON_403", False):
-                            raise ForbiddenRetry(
-                                f"AI Studio 403 Forbidden: {message}"
-                            )
+                            raise ForbiddenRetry(f"AI Studio 403 Forbidden: {message}")
                         else:
                             raise UpstreamError(
                                 f"AI Studio error: {message}",
@@ -230,56 +445,27 @@ async def use_stream_response(
                             )
 
                     parsed_data = actual_data
-                    p_reason = str(parsed_data.get("reason", ""))
-                    p_body = str(parsed_data.get("body", ""))
-
-                    if (
-                        p_reason
-                        and acc_reason_state
-                        and p_reason.startswith(acc_reason_state)
-                    ):
-                        new_reason_delta = p_reason[len(acc_reason_state) :]
-                        acc_reason_state = p_reason
-                    else:
-                        acc_reason_state += p_reason
-                        new_reason_delta = p_reason
-
-                    if p_body and acc_body_state and p_body.startswith(acc_body_state):
-                        acc_body_state = p_body
-                    else:
-                        acc_body_state += p_body
-
-                    if force_body_mode:
-                        parsed_data["reason"] = acc_reason_state[:split_index]
-                        parsed_data["body"] = (
-                            acc_body_state + acc_reason_state[split_index:]
-                        )
-                    else:
-                        text_to_check = boundary_buffer + new_reason_delta
-                        match = TOOL_STRUCTURE_PATTERN.search(text_to_check)
-                        if match:
-                            offset = len(acc_reason_state) - len(text_to_check)
-                            split_index = offset + match.start()
-                            force_body_mode = True
-                            boundary_transitions += 1
-                            parsed_data["reason"] = acc_reason_state[:split_index]
-                            parsed_data["body"] = (
-                                acc_body_state + acc_reason_state[split_index:]
-                            )
-                            logger.info(f"[{req_id}] ✂️ Boundary Split Applied.")
-                        else:
-                            parsed_data["reason"] = acc_reason_state
-                            parsed_data["body"] = acc_body_state
-                            boundary_buffer = (boundary_buffer + new_reason_delta)[
-                                -100:
-                            ]
-
-                    accumulated_body += str(parsed_data.get("body", ""))
-                    accumulated_reason_len += len(str(parsed_data.get("reason", "")))
-                    total_body_processed += len(str(parsed_data.get("body", "")))
-                    total_reason_processed += len(str(parsed_data.get("reason", "")))
-
-                    if parsed_data.get("body") or parsed_data.get("reason"):
+                    reason, body, split_applied = _apply_boundary(
+                        str(parsed_data.get("reason", "")),
+                        str(parsed_data.get("body", "")),
+                        stream_state,
+                    )
+                    parsed_data["reason"] = reason
+                    parsed_data["body"] = body
+                    if split_applied:
+                        boundary_transitions += 1
+                        logger.info(f"[{req_id}] ✂️ Boundary Split Applied.")
+
+                    # Packets carry cumulative text, so only lengths are tracked;
+                    # concatenating them would grow quadratically.
+                    body_len = len(body)
+                    reason_len = len(reason)
+                    accumulated_body_len += body_len
+                    accumulated_reason_len += reason_len
+                    total_body_processed += body_len
+                    total_reason_processed += reason_len
+
+                    if body or reason:
                         has_content = True
 
                     if parsed_data.get("function"):
@@ -344,7 +530,7 @@ async def use_stream_response(
                                 break
                             # Only retry if we haven't found functions and body is also empty
                             # (indicates potential race condition with UI rendering)
-                            if accumulated_body:
+                            if accumulated_body_len:
                                 break  # We have body text, no need to wait for functions
                             await asyncio.sleep(0.3)
 
@@ -353,15 +539,15 @@ async def use_stream_response(
                             has_seen_functions = True
 
                         # If we have DOM text and accumulated body is empty, inject it to final chunk
-                        if dom_text and not accumulated_body:
+                        if dom_text and not accumulated_body_len:
                             parsed_data["body"] = dom_text
-                            accumulated_body = dom_text
+                            accumulated_body_len = len(dom_text)
 
                     yield parsed_data
                     if parsed_data.get("done") is True:
                         if (
                             accumulated_reason_len > 0
-                            and len(accumulated_body) == 0
+                            and accumulated_body_len == 0
                             and not has_seen_functions
                         ):
                             logger.info(
@@ -369,22 +555,23 @@ async def use_stream_response(
                             )
                             try:
                                 if page:
+                                    from browser_utils.page_controller import (
+                                        PageController,
+                                    )
+
                                     pc = PageController(page, logger, req_id)
-                                    for _ in range(20):
-                                        await asyncio.sleep(0.5)
-                                        dom_text = (
-                                            await pc.get_body_text_only_from_dom()
+                                    dom_text = await pc.wait_for_body_text(
+                                        timeout_ms=10000
+                                    )
+                                    if dom_text and dom_text.strip():
+                                        logger.info(
+                                            f"[{req_id}] ✅ DOM captured body: {len(dom_text)} chars"
                                         )
-                                        if dom_text and len(dom_text.strip()) > 0:
-                                            logger.info(
-                                                f"[{req_id}] ✅ DOM captured body: {len(dom_text)} chars"
-                                            )
-                                            yield {
-                                                "body": dom_text,
-                                                "reason": "",
-                                                "done": False,
-                                            }
-                                            break
+                                        yield {
+                                            "body": dom_text,
+                                            "reason": "",
+                                            "done": False,
+                                        }
                             except Exception as e:
                                 logger.error(f"[{req_id}] DOM Wait Error: {e}")
                         break
@@ -392,11 +579,12 @@ async def use_stream_response(
                         stale_done_ignored = False
                 continue
             except (queue.Empty, asyncio.QueueEmpty):
+                burst_count = 0
                 empty_count += 1
                 if (
                     enable_silence_detection
                     and received_items_count >= min_items_before_silence_check
-                    and time.time() - last_packet_time > silence_threshold
+                    and time.monotonic() - last_packet_time > silence_threshold
                 ):
                     logger.info(f"[{req_id}] 🔇 Stream silence detected.")
                     yield {
@@ -414,14 +602,7 @@ async def use_stream_response(
                     if GlobalState.IS_RECOVERING:
                         empty_count = 0
                         continue
-                    if (
-                        await check_ui_generation_active()
-                        and empty_count < hard_timeout_limit
-                    ):
-                        logger.warning(f"[{req_id}] Timeout but UI active. Snoozing...")
-                        empty_count = max(0, empty_count - int(max_empty_retries * 0.5))
-                        continue
-                    elif empty_count >= hard_timeout_limit:
+                    if empty_count >= hard_timeout_limit:
                         logger.error(f"[{req_id}] HARD TIMEOUT REACHED!")
                         yield {
                             "done": True,
@@ -430,6 +611,15 @@ async def use_stream_response(
                             "function": [],
                         }
                         return
+                    # Reuse the periodic probe instead of a round-trip on the exit path
+                    if ui_generation_active is None:
+                        ui_generation_active = await check_ui_generation_active()
+                    if ui_generation_active:
+                        logger.warning(f"[{req_id}] Timeout but UI active. Snoozing...")
+                        empty_count = max(0, empty_count - int(max_empty_retries * 0.5))
+                        # Probe afresh before snoozing again
+                        ui_generation_active = None
+                        continue
                     yield {
                         "done": True,
                         "reason": "internal_timeout",
@@ -445,8 +635,6 @@ async def use_stream_response(
                 if received_items_count == 0 and empty_count >= initial_wait_limit:
                     logger.error(f"[{req_id}] Stream has no data (TTFB Timeout).")
                     try:
-                        from api_utils.server_state import state
-
                         page_instance = state.page_instance
                         if page_instance:
                             await page_instance.reload()
@@ -460,10 +648,18 @@ async def use_stream_response(
                     }
                     return
                 if empty_count - last_ui_check_time >= ui_check_interval:
-                    if await check_ui_generation_active():
+                    ui_generation_active = await check_ui_generation_active()
+                    if ui_generation_active:
                         logger.info(f"[{req_id}] UI detected still generating...")
                     last_ui_check_time = empty_count
-                await asyncio.sleep(0.1)
+                if queue_signalled:
+                    # Pipe was readable but nothing could be read; don't spin
+                    queue_signalled = False
+                    await asyncio.sleep(_QUEUE_WAIT_TICK)
+                else:
+                    queue_signalled = await _wait_for_queue_data(
+                        queue_fd, _QUEUE_WAIT_TICK
+                    )
                 continue
     except asyncio.CancelledError:
         raise
@@ -480,10 +676,6 @@ async def use_stream_response(
 
 
 async def clear_stream_queue():
-    import queue
-
-    from api_utils.server_state import state
-
     STREAM_QUEUE = state.STREAM_QUEUE
     logger = state.logger
 
@@ -492,12 +684,15 @@ async def clear_stream_queue():
     cleared_count = 0
     while True:
         try:
-            await asyncio.to_thread(STREAM_QUEUE.get_nowait)
+            # get_nowait never blocks, so drain inline instead of via a thread
+            STREAM_QUEUE.get_nowait()
             cleared_count += 1
         except queue.Empty:
             break
         except Exception:
             break
+        if cleared_count % _CLEAR_YIELD_INTERVAL == 0:
+            await asyncio.sleep(0)
     if cleared_count > 0:
         logger.info(f"Stream queue cleared. Items: {cleared_count}")
 
@@ -2,6 +2,7 @@
 import asyncio
 import json
 import logging
+import re
 
 from playwright.async_api import BrowserContext as AsyncBrowserContext
 
@@ -11,6 +12,11 @@ from .scripts import add_init_scripts_to_context
 
 logger = logging.getLogger("AIStudioProxyServer")
 
+# Model list requests: the alkalimakersuite host's ListModels endpoint
+MODEL_LIST_URL_PATTERN = re.compile(r"alkalimakersuite.*ListModels")
+
+ANTI_HIJACK_PREFIX = b")]}'\n"
+
 
 async def setup_network_interception_and_scripts(context: AsyncBrowserContext):
     """Setup network interception and script injection"""
@@ -42,30 +48,25 @@ async def _setup_model_list_interception(context: AsyncBrowserContext):
         async def handle_model_list_route(route):
             """Handle model list request route"""
             request = route.request
+            logger.info(f"Intercepted model list request: {request.url}")
 
-            # Check if it's a model list request
-            if "alkalimakersuite" in request.url and "ListModels" in request.url:
-                logger.info(f"Intercepted model list request: {request.url}")
-
-                # Continue original request
-                response = await route.fetch()
+            # Continue original request
+            response = await route.fetch()
 
-                # Get original response body
-                original_body = await response.body()
+            # Get original response body
+            original_body = await response.body()
 
-                # Process response
-                modified_body = await _modify_model_list_response(
-                    original_body, request.url
-                )
+            # Process response
+            modified_body = await _modify_model_list_response(
+                original_body, request.url
+            )
 
-                # Return modified response
-                await route.fulfill(response=response, body=modified_body)
-            else:
-                # For other requests, continue normally
-                await route.continue_()
+            # Return modified response
+            await route.fulfill(response=response, body=modified_body)
 
-        # Register route interceptor
-        await context.route("**/*", handle_model_list_route)
+        # Register route interceptor for the model list endpoint only, so other
+        # page requests are never routed through Python
+        await context.route(MODEL_LIST_URL_PATTERN, handle_model_list_route)
         logger.info("Model list network interception setup")
 
     except asyncio.CancelledError:
@@ -77,31 +78,30 @@ async def _setup_model_list_interception(context: AsyncBrowserContext):
 async def _modify_model_list_response(original_body: bytes, url: str) -> bytes:
     """Modify model list response (Cleanup/Pass-through)"""
     try:
-        # Decode response body
-        original_text = original_body.decode("utf-8")
-
-        # Handle anti-hijack prefix
-        ANTI_HIJACK_PREFIX = ")]}'\n"
-        has_prefix = False
-        if original_text.startswith(ANTI_HIJACK_PREFIX):
-            original_text = original_text[len(ANTI_HIJACK_PREFIX) :]
-            has_prefix = True
+        # Handle anti-hijack prefix on the raw bytes; json.loads parses
+        # UTF-8 bytes directly, so the body is never decoded to str
+        body = original_body
+        has_prefix = body.startswith(ANTI_HIJACK_PREFIX)
+        if has_prefix:
+            body = body[len(ANTI_HIJACK_PREFIX) :]
 
         # Parse JSON to ensure it's valid, but we don't inject models anymore
         try:
-            json_data = json.loads(original_text)
-        except json.JSONDecodeError as json_err:
+            json_data = json.loads(body)
+        except ValueError as json_err:
             logger.error(f"Failed to parse model list response JSON: {json_err}")
             return original_body
 
-        # Serialize back to JSON
-        modified_text = json.dumps(json_data, separators=(",", ":"))
+        # Serialize back to compact JSON
+        modified_body = json.dumps(
+            json_data, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
 
         # Add prefix back
         if has_prefix:
-            modified_text = ANTI_HIJACK_PREFIX + modified_text
+            modified_body = ANTI_HIJACK_PREFIX + modified_body
 
-        return modified_text.encode("utf-8")
+        return modified_body
 
     except asyncio.CancelledError:
         raise
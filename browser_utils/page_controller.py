@@ -42,6 +42,43 @@ from .page_controller_modules.parameters import ParameterController
 from .page_controller_modules.response import ResponseController
 from .page_controller_modules.thinking import ThinkingController
 
+# [THINKING]...[/THINKING] blocks embedded in assembled response text
+_THINKING_BLOCK_RE = re.compile(r"\[THINKING\](.*?)\[/THINKING\]", re.DOTALL)
+
+# Resolves with the last response element's text as soon as it is non-empty,
+# or with whatever is there (possibly "") once the timeout expires.
+_WAIT_FOR_BODY_TEXT_JS = """([selector, timeoutMs]) => new Promise((resolve) => {
+    const read = () => {
+        const nodes = document.querySelectorAll(selector);
+        const last = nodes[nodes.length - 1];
+        const text = last ? last.innerText : "";
+        return text && text.trim() ? text : null;
+    };
+    const initial = read();
+    if (initial) {
+        resolve(initial);
+        return;
+    }
+    let timer = null;
+    const observer = new MutationObserver(() => {
+        const text = read();
+        if (text) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(text);
+        }
+    });
+    timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(read() || "");
+    }, timeoutMs);
+    observer.observe(document.body, {
+        childList: true,
+        subtree: true,
+        characterData: true,
+    });
+})"""
+
 
 class PageController(
     ParameterController,
@@ -335,12 +372,18 @@ class PageController(
         """Separate thinking and response."""
         if not content:
             return "", ""
-        m = re.findall(r"\[THINKING\](.*?)\[/THINKING\]", content, re.DOTALL)
-        r = "\n".join(m).strip()
-        c = re.sub(
-            r"\[THINKING\](.*?)\[/THINKING\]", "", content, flags=re.DOTALL
-        ).strip()
-        return c, r
+        # One pass: text between blocks is response, block contents are thinking
+        reason_parts = []
+        body_parts = []
+        pos = 0
+        for match in _THINKING_BLOCK_RE.finditer(content):
+            body_parts.append(content[pos : match.start()])
+            reason_parts.append(match.group(1))
+            pos = match.end()
+        if not reason_parts:
+            return content.strip(), ""
+        body_parts.append(content[pos:])
+        return "".join(body_parts).strip(), "\n".join(reason_parts).strip()
 
     async def _emergency_stability_wait(
         self, check_client_disconnected: Callable
@@ -373,3 +416,35 @@ class PageController(
     async def get_body_text_only_from_dom(self) -> str:
         """Extract body text only."""
         return await self._extract_dom_content()
+
+    async def wait_for_body_text(self, timeout_ms: int = 10000) -> str:
+        """Wait until the response body text appears in the DOM.
+
+        A MutationObserver inside the page resolves as soon as the text is
+        non-empty, so this costs a single round-trip. If the observer script
+        fails, falls back to polling get_body_text_only_from_dom.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds.
+
+        Returns:
+            The body text, or "" if none appeared before the timeout.
+        """
+        from config.selectors import FINAL_RESPONSE_SELECTOR
+
+        try:
+            text = await self.page.evaluate(
+                _WAIT_FOR_BODY_TEXT_JS, [FINAL_RESPONSE_SELECTOR, timeout_ms]
+            )
+            return text if isinstance(text, str) else ""
+        except Exception as e:
+            self.logger.debug(
+                f"[{self.req_id}] Body text observer failed, polling instead: {e}"
+            )
+
+        for _ in range(max(1, timeout_ms // 500)):
+            await asyncio.sleep(0.5)
+            text = await self.get_body_text_only_from_dom()
+            if text and text.strip():
+                return text
+        return ""
@@ -1,9 +1,23 @@
-from typing import Callable
+from typing import Callable, Dict, Optional
 
 from playwright.async_api import Page as AsyncPage
 
 from models import ClientDisconnectedError
 
+# Visibility, checked and disabled state of the first matched toggle, or null
+_TOGGLE_STATE_JS = """(els) => {
+    if (!els.length) return null;
+    const el = els[0];
+    const rect = el.getBoundingClientRect();
+    return {
+        visible: rect.width > 0 && rect.height > 0 &&
+            getComputedStyle(el).visibility !== 'hidden',
+        checked: el.getAttribute('aria-checked') === 'true',
+        disabled: el.hasAttribute('disabled') ||
+            el.classList.contains('mdc-switch--disabled'),
+    };
+}"""
+
 
 class BaseController:
     """Base controller providing common functionality."""
@@ -19,3 +33,15 @@ class BaseController:
             raise ClientDisconnectedError(
                 f"[{self.req_id}] Client disconnected at stage: {stage}"
             )
+
+    async def _read_toggle_state(self, toggle_locator) -> Optional[Dict[str, bool]]:
+        """Read a toggle's state in a single browser round-trip.
+
+        Args:
+            toggle_locator: Locator of the toggle switch.
+
+        Returns:
+            Dict with ``visible``, ``checked`` and ``disabled`` flags for the
+            first matching element, or None if nothing matches.
+        """
+        return await toggle_locator.evaluate_all(_TOGGLE_STATE_JS)
@@ -21,6 +21,32 @@ from models import ClientDisconnectedError
 
 from .base import BaseController
 
+# Use centralized selectors supporting new and old UI structures:
+# .text-wrapper elements first, then ms-autosize-textarea elements
+_AUTOSIZE_WRAPPER_SELECTOR_GROUPS = (
+    build_combined_selector(AUTOSIZE_WRAPPER_SELECTORS[:2]),
+    build_combined_selector(AUTOSIZE_WRAPPER_SELECTORS[2:]),
+)
+
+# Sets the textarea value, fires input/change, and copies the text onto the
+# autosize wrapper's data-value. Returns an error message if only the wrapper
+# update failed.
+_FILL_PROMPT_JS = """
+(element, [text, wrapperSelector, legacyWrapperSelector]) => {
+    element.value = text;
+    element.dispatchEvent(new Event('input', { bubbles: true, cancelable: true }));
+    element.dispatchEvent(new Event('change', { bubbles: true, cancelable: true }));
+    try {
+        const wrapper = document.querySelector(wrapperSelector)
+            || document.querySelector(legacyWrapperSelector);
+        if (wrapper) wrapper.setAttribute("data-value", text);
+        return null;
+    } catch (e) {
+        return String(e);
+    }
+}
+"""
+
 
 class InputController(BaseController):
     """Handles prompt input and submission."""
@@ -32,17 +58,6 @@ class InputController(BaseController):
         set_request_id(self.req_id)
         self.logger.debug(f"[Input] Filling prompt ({len(prompt)} chars)")
         prompt_textarea_locator = self.page.locator(PROMPT_TEXTAREA_SELECTOR)
-        # Use centralized selectors supporting new and old UI structures
-        autosize_wrapper_locator = self.page.locator(
-            build_combined_selector(
-                AUTOSIZE_WRAPPER_SELECTORS[:2]
-            )  # .text-wrapper element
-        )
-        legacy_autosize_wrapper = self.page.locator(
-            build_combined_selector(
-                AUTOSIZE_WRAPPER_SELECTORS[2:]
-            )  # ms-autosize-textarea element
-        )
         submit_button_locator = self.page.locator(SUBMIT_BUTTON_SELECTOR)
 
         try:
@@ -51,30 +66,12 @@ class InputController(BaseController):
                 check_client_disconnected, "After Input Visible"
             )
 
-            # Fill text using JavaScript
-            await prompt_textarea_locator.evaluate(
-                """
-                (element, text) => {
-                    element.value = text;
-                    element.dispatchEvent(new Event('input', { bubbles: true, cancelable: true }));
-                    element.dispatchEvent(new Event('change', { bubbles: true, cancelable: true }));
-                }
-                """,
-                prompt,
+            # Fill text and mirror it onto the autosize wrapper in one round-trip
+            autosize_err = await prompt_textarea_locator.evaluate(
+                _FILL_PROMPT_JS, [prompt, *_AUTOSIZE_WRAPPER_SELECTOR_GROUPS]
             )
-            autosize_target = autosize_wrapper_locator
-            if await autosize_target.count() == 0:
-                autosize_target = legacy_autosize_wrapper
-            if await autosize_target.count() > 0:
-                try:
-                    await autosize_target.first.evaluate(
-                        '(element, text) => { element.setAttribute("data-value", text); }',
-                        prompt,
-                    )
-                except Exception as autosize_err:
-                    self.logger.debug(
-                        f"autosize wrapper update skipped: {autosize_err}"
-                    )
+            if autosize_err:
+                self.logger.debug(f"autosize wrapper update skipped: {autosize_err}")
             await self._check_disconnect(check_client_disconnected, "After Input Fill")
 
             # Attachment upload handled below if needed
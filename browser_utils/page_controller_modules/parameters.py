@@ -559,17 +559,24 @@ class ParameterController(BaseController):
             self.logger.info(f"Checking and {action} URL Context...")
             use_url_content_selector = self.page.locator(USE_URL_CONTEXT_SELECTOR)
 
-            # Use a shorter timeout to check visibility
-            if await use_url_content_selector.count() == 0:
+            toggle_state = await self._read_toggle_state(use_url_content_selector)
+            if toggle_state is None:
                 self.logger.debug(
                     f"[Param] URL Context toggle not found, skipping {action}"
                 )
                 return
 
-            await expect_async(use_url_content_selector).to_be_visible(timeout=2000)
+            if not toggle_state["visible"]:
+                # Use a shorter timeout to check visibility
+                await expect_async(use_url_content_selector).to_be_visible(timeout=2000)
+                toggle_state = await self._read_toggle_state(use_url_content_selector)
+                if toggle_state is None:
+                    self.logger.warning(
+                        f"URL Context toggle disappeared after becoming visible, skipping {action}"
+                    )
+                    return
 
-            is_checked = await use_url_content_selector.get_attribute("aria-checked")
-            is_currently_enabled = is_checked == "true"
+            is_currently_enabled = toggle_state["checked"]
 
             if is_currently_enabled != enable:
                 self.logger.info(
@@ -648,13 +655,20 @@ class ParameterController(BaseController):
 
         try:
             toggle_locator = self.page.locator(toggle_selector)
-            await expect_async(toggle_locator).to_be_visible(timeout=5000)
+            toggle_state = await self._read_toggle_state(toggle_locator)
+            if not toggle_state or not toggle_state["visible"]:
+                await expect_async(toggle_locator).to_be_visible(timeout=5000)
+                toggle_state = await self._read_toggle_state(toggle_locator)
+                if toggle_state is None:
+                    self.logger.warning(
+                        "Google Search toggle disappeared after becoming visible, skipping"
+                    )
+                    return
             await self._check_disconnect(
                 check_client_disconnected, "Google Search toggle visible"
             )
 
-            is_checked_str = await toggle_locator.get_attribute("aria-checked")
-            is_currently_checked = is_checked_str == "true"
+            is_currently_checked = toggle_state["checked"]
 
             if should_enable_search == is_currently_checked:
                 self.logger.debug(
@@ -667,9 +681,7 @@ class ParameterController(BaseController):
             )
 
             # Check if the toggle is disabled (e.g., when function calling is enabled)
-            is_disabled = await toggle_locator.get_attribute("disabled")
-            toggle_class = await toggle_locator.get_attribute("class") or ""
-            if is_disabled is not None or "mdc-switch--disabled" in toggle_class:
+            if toggle_state["disabled"]:
                 self.logger.debug(
                     "[Param] Google Search: Toggle is disabled (likely due to function calling being enabled), skipping"
                 )
@@ -1,5 +1,6 @@
 import asyncio
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Any, Callable, Dict, Optional
 
 from playwright.async_api import TimeoutError
@@ -42,6 +43,29 @@ class ThinkingCategory(Enum):
     THINKING_LEVEL_FLASH = auto()  # 4-level dropdown (gemini-3-flash*)
 
 
+@lru_cache(maxsize=128)
+def _thinking_category_for(model_id: str) -> ThinkingCategory:
+    """Map a model ID to its thinking category (cached; model IDs repeat)."""
+    mid = model_id.lower()
+
+    if "gemini-3" in mid and "flash" in mid:
+        return ThinkingCategory.THINKING_LEVEL_FLASH
+
+    if "gemini-3" in mid and "pro" in mid:
+        return ThinkingCategory.THINKING_LEVEL
+
+    if "gemini-2.5-pro" in mid:
+        return ThinkingCategory.THINKING_PRO
+
+    if "gemini-2.5-flash" in mid:
+        return ThinkingCategory.THINKING_FLASH
+
+    if mid == "gemini-flash-latest" or mid == "gemini-flash-lite-latest":
+        return ThinkingCategory.THINKING_FLASH
+
+    return ThinkingCategory.NON_THINKING
+
+
 class ThinkingController(BaseController):
     """Handles thinking mode and budget logic."""
 
@@ -83,6 +107,12 @@ class ThinkingController(BaseController):
                 self.logger.debug(
                     f"[Thinking] Directive: {format_directive_log(directive)}"
                 )
+                # String efforts are matched case-insensitively below; normalize once
+                effort_str = (
+                    reasoning_effort.strip().lower()
+                    if isinstance(reasoning_effort, str)
+                    else None
+                )
 
                 # More resilient level check: check if dropdown exists even if category doesn't strictly require it
                 actually_has_dropdown = await self._has_thinking_dropdown()
@@ -103,10 +133,10 @@ class ThinkingController(BaseController):
                         f"[Thinking] Detected level dropdown for model category {category}. Switching to level-based logic."
                     )
 
-                def _should_enable_from_raw(rv: Any) -> bool:
+                def _should_enable_from_raw(rv: Any, rs: Optional[str]) -> bool:
+                    """rs is the normalized string form of rv, or None."""
                     try:
-                        if isinstance(rv, str):
-                            rs = rv.strip().lower()
+                        if rs is not None:
                             if rs in ["high", "medium", "low", "minimal", "-1"]:
                                 return True
                             if rs == "none":
@@ -120,7 +150,7 @@ class ThinkingController(BaseController):
                     return False
 
                 desired_enabled = directive.thinking_enabled or _should_enable_from_raw(
-                    reasoning_effort
+                    reasoning_effort, effort_str
                 )
 
                 # Special logic: for models using levels (Gemini 3 Pro), if reasoning_effort is not specified,
@@ -171,8 +201,8 @@ class ThinkingController(BaseController):
                     level_to_set = None
                     is_flash_4_level = category == ThinkingCategory.THINKING_LEVEL_FLASH
 
-                    if isinstance(rv, str):
-                        rs = rv.strip().lower()
+                    if effort_str is not None:
+                        rs = effort_str
                         if is_flash_4_level:
                             # Gemini 3 Flash: 4 levels (minimal, low, medium, high)
                             if rs in ["minimal", "low", "medium", "high"]:
@@ -334,25 +364,7 @@ class ThinkingController(BaseController):
         """Return thinking category based on model ID."""
         if not model_id:
             return ThinkingCategory.NON_THINKING
-
-        mid = model_id.lower()
-
-        if "gemini-3" in mid and "flash" in mid:
-            return ThinkingCategory.THINKING_LEVEL_FLASH
-
-        if "gemini-3" in mid and "pro" in mid:
-            return ThinkingCategory.THINKING_LEVEL
-
-        if "gemini-2.5-pro" in mid:
-            return ThinkingCategory.THINKING_PRO
-
-        if "gemini-2.5-flash" in mid:
-            return ThinkingCategory.THINKING_FLASH
-
-        if mid == "gemini-flash-latest" or mid == "gemini-flash-lite-latest":
-            return ThinkingCategory.THINKING_FLASH
-
-        return ThinkingCategory.NON_THINKING
+        return _thinking_category_for(model_id)
 
     async def _set_thinking_level(
         self, level: str, check_client_disconnected: Callable
@@ -584,8 +596,8 @@ class ThinkingController(BaseController):
         try:
             toggle_locator = self.page.locator(toggle_selector)
 
-            element_count = await toggle_locator.count()
-            if element_count == 0:
+            toggle_state = await self._read_toggle_state(toggle_locator)
+            if toggle_state is None:
                 if not should_be_enabled:
                     self.logger.info(
                         "Main thinking toggle not found (unsupported), skipping disable."
@@ -597,24 +609,21 @@ class ThinkingController(BaseController):
                     )
                     return False
 
-            await expect_async(toggle_locator).to_be_visible(timeout=5000)
-            try:
-                await toggle_locator.scroll_into_view_if_needed()
-            except asyncio.CancelledError:
-                self.logger.info(
-                    f"[{self.req_id}] Thinking mode toggle control cancelled."
-                )
-                raise
-            except Exception:
-                pass
+            if not toggle_state["visible"]:
+                await expect_async(toggle_locator).to_be_visible(timeout=5000)
+                toggle_state = await self._read_toggle_state(toggle_locator)
+                if toggle_state is None:
+                    self.logger.warning(
+                        "Main thinking toggle disappeared after becoming visible, skipping."
+                    )
+                    return not should_be_enabled
             await self._check_disconnect(
                 check_client_disconnected, "Main thinking toggle - after visible"
             )
 
-            is_checked_str = await toggle_locator.get_attribute("aria-checked")
-            current_state_is_enabled = is_checked_str == "true"
+            current_state_is_enabled = toggle_state["checked"]
             self.logger.info(
-                f"Main thinking toggle current state: {is_checked_str} (Enabled: {current_state_is_enabled})"
+                f"Main thinking toggle current state (Enabled: {current_state_is_enabled})"
             )
 
             if current_state_is_enabled != should_be_enabled:
@@ -623,6 +632,16 @@ class ThinkingController(BaseController):
                     f"Main thinking toggle mismatch, clicking to {action} thinking mode..."
                 )
 
+                try:
+                    await toggle_locator.scroll_into_view_if_needed()
+                except asyncio.CancelledError:
+                    self.logger.info(
+                        f"[{self.req_id}] Thinking mode toggle control cancelled."
+                    )
+                    raise
+                except Exception:
+                    pass
+
                 try:
                     await toggle_locator.click(timeout=CLICK_TIMEOUT_MS)
                 except asyncio.CancelledError:
@@ -697,8 +716,8 @@ class ThinkingController(BaseController):
         try:
             toggle_locator = self.page.locator(toggle_selector)
 
-            element_count = await toggle_locator.count()
-            if element_count == 0:
+            toggle_state = await self._read_toggle_state(toggle_locator)
+            if toggle_state is None:
                 if not should_be_checked:
                     self.logger.info(
                         "Thinking budget toggle not found, skipping disable."
@@ -710,24 +729,21 @@ class ThinkingController(BaseController):
                     )
                     return
 
-            await expect_async(toggle_locator).to_be_visible(timeout=5000)
-            try:
-                await toggle_locator.scroll_into_view_if_needed()
-            except asyncio.CancelledError:
-                self.logger.info(
-                    f"[{self.req_id}] Thinking budget toggle control cancelled."
-                )
-                raise
-            except Exception:
-                pass
+            if not toggle_state["visible"]:
+                await expect_async(toggle_locator).to_be_visible(timeout=5000)
+                toggle_state = await self._read_toggle_state(toggle_locator)
+                if toggle_state is None:
+                    self.logger.warning(
+                        "Thinking budget toggle disappeared after becoming visible, skipping."
+                    )
+                    return
             await self._check_disconnect(
                 check_client_disconnected, "Thinking budget toggle - after visible"
             )
 
-            is_checked_str = await toggle_locator.get_attribute("aria-checked")
-            current_state_is_checked = is_checked_str == "true"
+            current_state_is_checked = toggle_state["checked"]
             self.logger.info(
-                f"Thinking budget toggle current 'aria-checked': {is_checked_str} (Checked: {current_state_is_checked})"
+                f"Thinking budget toggle current state (Checked: {current_state_is_checked})"
             )
 
             if current_state_is_checked != should_be_checked:
@@ -735,6 +751,16 @@ class ThinkingController(BaseController):
                 self.logger.info(
                     f"Thinking budget toggle mismatch, clicking to {action}..."
                 )
+                try:
+                    await toggle_locator.scroll_into_view_if_needed()
+                except asyncio.CancelledError:
+                    self.logger.info(
+                        f"[{self.req_id}] Thinking budget toggle control cancelled."
+                    )
+                    raise
+                except Exception:
+                    pass
+
                 try:
                     await toggle_locator.click(timeout=CLICK_TIMEOUT_MS)
                 except asyncio.CancelledError:
@@ -1,23 +1,54 @@
-# Chat related models
-from .chat import (
-    ChatCompletionRequest,
-    FunctionCall,
-    Message,
-    MessageContentItem,
-    ToolCall,
-)
-
-# Exception classes
-from .exceptions import (
-    ClientDisconnectedError,
-    ForbiddenRetry,
-    QuotaExceededError,
-    QuotaExceededRetry,
-    UpstreamError,
-)
-
-# Logging utility classes
-from .logging import StreamToLogger, WebSocketConnectionManager, WebSocketLogHandler
+"""
+Models package.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+e.g. ``ClientDisconnectedError`` does not pull in the pydantic chat models or
+the FastAPI websocket logging handlers.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .chat import (
+        ChatCompletionRequest,
+        FunctionCall,
+        Message,
+        MessageContentItem,
+        ToolCall,
+    )
+    from .exceptions import (
+        ClientDisconnectedError,
+        ForbiddenRetry,
+        QuotaExceededError,
+        QuotaExceededRetry,
+        UpstreamError,
+    )
+    from .logging import (
+        StreamToLogger,
+        WebSocketConnectionManager,
+        WebSocketLogHandler,
+    )
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS: Dict[str, str] = {
+    # Chat models
+    "FunctionCall": "chat",
+    "ToolCall": "chat",
+    "MessageContentItem": "chat",
+    "Message": "chat",
+    "ChatCompletionRequest": "chat",
+    # Exceptions
+    "ClientDisconnectedError": "exceptions",
+    "ForbiddenRetry": "exceptions",
+    "QuotaExceededError": "exceptions",
+    "QuotaExceededRetry": "exceptions",
+    "UpstreamError": "exceptions",
+    # Logging tools
+    "StreamToLogger": "logging",
+    "WebSocketConnectionManager": "logging",
+    "WebSocketLogHandler": "logging",
+}
 
 __all__ = [
     # Chat models
@@ -37,3 +68,17 @@ __all__ = [
     "WebSocketConnectionManager",
     "WebSocketLogHandler",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache the name."""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,171 @@
+"""
+Profile the native function calling hot paths with synthetic workloads.
+
+Workloads:
+- schema: convert a 50-tool OpenAI schema to Gemini declarations
+  (cold = memoization cache cleared before every run, warm = cache hits)
+- stream: format a tool call with ~5KB of arguments into streaming deltas
+  (dict chunks and pre-serialized JSON chunks)
+
+For each workload the script reports wall time per call and bytes allocated
+per call (tracemalloc). A workload whose time is dominated by allocations
+(high bytes/call, many small objects) benefits from fewer intermediate
+objects; one with low allocation but high time is bound on Python-level
+compute. Use --cprofile to see which functions dominate.
+
+Usage:
+    python scripts/profile_function_calling.py
+    python scripts/profile_function_calling.py --workload stream --cprofile
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api_utils.utils_ext.function_calling import (  # noqa: E402
+    ParsedFunctionCall,
+    ResponseFormatter,
+    SchemaConverter,
+    _conversion_cache,
+)
+
+
+def build_tools(count: int = 50) -> List[Dict[str, Any]]:
+    """Build a realistic tool list with nested, partly non-compliant schemas."""
+    tools = []
+    for i in range(count):
+        tools.append(
+            {
+                "type": "function",
+                "function": {
+                    "name": f"tool_{i}",
+                    "description": f"Synthetic tool number {i}",
+                    "strict": True,
+                    "parameters": {
+                        "type": "object",
+                        "additionalProperties": False,
+                        "properties": {
+                            "query": {"type": "string", "title": "Query"},
+                            "limit": {"type": ["integer", "null"], "default": 10},
+                            "filters": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "field": {"type": "string"},
+                                        "value": {
+                                            "anyOf": [
+                                                {"type": "string"},
+                                                {"type": "null"},
+                                            ]
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                        "required": ["query"],
+                    },
+                },
+            }
+        )
+    return tools
+
+
+def build_call(size: int = 5000) -> ParsedFunctionCall:
+    """Build a parsed call whose serialized arguments are roughly `size` chars."""
+    return ParsedFunctionCall(
+        name="write_file",
+        arguments={"path": "notes/output.md", "content": "lorem ipsum " * (size // 12)},
+    )
+
+
+def measure(name: str, func: Callable[[], Any], iterations: int) -> None:
+    """Print time and allocated bytes per call for `func`."""
+    func()  # warm up imports and caches
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    snapshot_start = tracemalloc.take_snapshot()
+    func()
+    snapshot_end = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    allocated = sum(
+        stat.size_diff
+        for stat in snapshot_end.compare_to(snapshot_start, "filename")
+        if stat.size_diff > 0
+    )
+    print(
+        f"{name:<28} {elapsed / iterations * 1e6:>10.1f} us/call "
+        f"{allocated:>10} B retained {peak:>10} B peak"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument(
+        "--workload", choices=["schema", "stream", "all"], default="all"
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--cprofile", action="store_true", help="Print top functions by time"
+    )
+    args = parser.parse_args()
+
+    converter = SchemaConverter()
+    formatter = ResponseFormatter()
+    tools = build_tools()
+    call = build_call()
+
+    def schema_cold() -> None:
+        _conversion_cache.clear()
+        converter.convert_tools(tools)
+
+    def schema_warm() -> None:
+        converter.convert_tools(tools)
+
+    def stream_dicts() -> None:
+        formatter.format_streaming_chunks(0, call)
+        formatter.id_manager.clear()
+
+    def stream_json() -> None:
+        formatter.format_streaming_chunks_json(0, call)
+        formatter.id_manager.clear()
+
+    workloads: Dict[str, Callable[[], None]] = {}
+    if args.workload in ("schema", "all"):
+        workloads["schema (50 tools, cold)"] = schema_cold
+        workloads["schema (50 tools, warm)"] = schema_warm
+    if args.workload in ("stream", "all"):
+        workloads["stream (5KB args, dicts)"] = stream_dicts
+        workloads["stream (5KB args, json)"] = stream_json
+
+    for name, func in workloads.items():
+        measure(name, func, args.iterations)
+
+    if args.cprofile:
+        for name, func in workloads.items():
+            print(f"\n=== cProfile: {name} ===")
+            profiler = cProfile.Profile()
+            profiler.enable()
+            for _ in range(args.iterations):
+                func()
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(10)
+
+
+if __name__ == "__main__":
+    main()
@@ -353,16 +353,19 @@ class HttpInterceptor:
                 return {}
 
             func_params = {}
+            # Formatting nested values is costly; skip it unless DEBUG is on
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
             for param in params:
                 param_name = param[0]
                 param_value = param[1]
 
                 # Debug: log raw param_value structure
-                self.logger.debug(
-                    f"Parsing param '{param_name}': type={type(param_value).__name__}, "
-                    f"len={len(param_value) if isinstance(param_value, list) else 'N/A'}, "
-                    f"value={str(param_value)[:100]}"
-                )
+                if debug_enabled:
+                    self.logger.debug(
+                        f"Parsing param '{param_name}': type={type(param_value).__name__}, "
+                        f"len={len(param_value) if isinstance(param_value, list) else 'N/A'}, "
+                        f"value={str(param_value)[:100]}"
+                    )
 
                 if isinstance(param_value, list):
                     if len(param_value) == 1:  # null
@@ -412,14 +415,18 @@ class HttpInterceptor:
         - Wrapped items: [[...actual item...]] - extra nesting layer
         - Object items with param lists inside
         """
-        self.logger.debug(
-            f"_parse_array_items input (len={len(array_items)}): {array_items[:3] if len(array_items) > 3 else array_items}"
-        )
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.logger.debug(
+                f"_parse_array_items input (len={len(array_items)}): {array_items[:3] if len(array_items) > 3 else array_items}"
+            )
         result = []
         for i, item in enumerate(array_items):
-            self.logger.debug(f"  Array item[{i}] raw: {item}")
+            if debug_enabled:
+                self.logger.debug(f"  Array item[{i}] raw: {item}")
             parsed = self._parse_single_array_item(item)
-            self.logger.debug(f"  Array item[{i}] parsed: {parsed}")
+            if debug_enabled:
+                self.logger.debug(f"  Array item[{i}] parsed: {parsed}")
             result.append(parsed)
         return result
 
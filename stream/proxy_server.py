@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import socket
 import ssl
@@ -401,7 +400,7 @@ class ProxyServer:
                                             "message": f"{status_code} {status_message}",
                                             "done": True,
                                         }
-                                        self.queue.put(json.dumps(error_payload))
+                                        self.queue.put(error_payload)
                                 else:
                                     resp = await self.interceptor.process_response(
                                         bytes(body_data), host, "", headers
@@ -411,7 +410,7 @@ class ProxyServer:
                                             "ts": request_context.get("request_ts", 0),
                                             "data": resp,
                                         }
-                                        self.queue.put(json.dumps(payload))
+                                        self.queue.put(payload)
                                         if resp.get("done", False):
                                             self.logger.debug(
                                                 f"[Proxy] Stream complete: body={len(resp.get('body', ''))}"
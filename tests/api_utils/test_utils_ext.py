@@ -1,4 +1,5 @@
 import base64
+import itertools
 import json
 import queue
 import time
@@ -6,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import pytest
 
+import api_utils.utils_ext.stream as stream_module
 from api_utils.server_state import state
 from api_utils.utils_ext.files import (
     _extension_for_mime,
@@ -13,7 +15,12 @@ from api_utils.utils_ext.files import (
     save_blob_to_local,
 )
 from api_utils.utils_ext.helper import use_helper_get_response
-from api_utils.utils_ext.stream import clear_stream_queue, use_stream_response
+from api_utils.utils_ext.stream import (
+    StreamState,
+    _apply_boundary,
+    clear_stream_queue,
+    use_stream_response,
+)
 from api_utils.utils_ext.tokens import calculate_usage_stats, estimate_tokens
 from api_utils.utils_ext.validation import validate_chat_request
 from models import Message
@@ -302,6 +309,38 @@ async def test_use_stream_response_timeout():
         assert mock_sleep.call_count >= 1
 
 
+@pytest.mark.asyncio
+async def test_use_stream_response_silence_uses_monotonic_clock():
+    """
+    Test scenario: The wall clock jumps while the monotonic clock reports silence
+    Expected: Silence is detected from the monotonic clock only
+    """
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = [
+        {"body": f"chunk{i}", "done": False} for i in range(10)
+    ] + [queue.Empty] * 50
+
+    mock_time = MagicMock()
+    # Wall clock is frozen; monotonic advances one second per reading
+    mock_time.time.return_value = time.time()
+    mock_time.monotonic.side_effect = itertools.count(start=1000.0)
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch.object(stream_module, "time", mock_time),
+        patch("asyncio.sleep", new_callable=AsyncMock),
+    ):
+        chunks = [
+            chunk
+            async for chunk in use_stream_response(
+                "req1", enable_silence_detection=True, silence_threshold=5.0
+            )
+        ]
+
+    assert chunks[-1]["reason"] == "silence_detected"
+
+
 @pytest.mark.asyncio
 async def test_use_stream_response_mixed_types():
     # Test non-JSON string and dictionary data
@@ -361,16 +400,35 @@ async def test_clear_stream_queue():
     with (
         patch.object(state, "STREAM_QUEUE", mock_queue),
         patch.object(state, "logger") as mock_logger,
-        patch("asyncio.to_thread", side_effect=mock_queue.get_nowait),
+        patch("asyncio.to_thread") as mock_to_thread,
     ):
         await clear_stream_queue()
 
-        # Should have called get_nowait 3 times via to_thread
+        # Drained inline, without a thread hop per item
+        assert mock_queue.get_nowait.call_count == 3
+        mock_to_thread.assert_not_called()
         # Verify debug log for queue cleared
         info_calls = [str(c) for c in mock_logger.info.call_args_list]
         assert any("Stream queue cleared" in c for c in info_calls)
 
 
+@pytest.mark.asyncio
+async def test_clear_stream_queue_yields_during_large_drain():
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = [f"item{i}" for i in range(600)] + [queue.Empty]
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        await clear_stream_queue()
+
+    assert mock_queue.get_nowait.call_count == 601
+    # One cooperative yield per 256 drained items
+    assert mock_sleep.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_clear_stream_queue_none():
     with patch.object(state, "STREAM_QUEUE", None), patch.object(state, "logger"):
@@ -556,6 +614,469 @@ async def test_use_stream_response_generic_exception():
         assert len(error_calls) > 0
 
 
+@pytest.mark.asyncio
+async def test_use_stream_response_installs_scroll_helper_once():
+    """
+    Test scenario: Several packets are streamed with a page attached
+    Expected: Scroll helper is installed once, later ticks only invoke it
+    """
+    from api_utils.utils_ext.stream import _SCROLL_CALL_JS, _SCROLL_INSTALL_JS
+
+    q_data = [
+        {"body": "a", "done": False},
+        queue.Empty(),
+        {"body": "b", "done": False},
+        queue.Empty(),
+        {"body": "c", "done": True},
+    ]
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = q_data + [queue.Empty()]
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        patch(
+            "api_utils.utils_ext.stream.detect_function_calls_from_dom",
+            new_callable=AsyncMock,
+            return_value=([], ""),
+        ),
+    ):
+        chunks = [chunk async for chunk in use_stream_response("req1", page=page)]
+
+    assert len(chunks) == 3
+    scripts = [c.args[0] for c in page.evaluate.call_args_list]
+    assert scripts.count(_SCROLL_INSTALL_JS) == 1
+    assert scripts.count(_SCROLL_CALL_JS) == 3
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_runs_checks_once_per_burst():
+    """
+    Test scenario: Several packets are already queued back to back
+    Expected: Per-pass work (scrolling) runs once for the whole burst
+    """
+    from api_utils.utils_ext.stream import _SCROLL_CALL_JS
+
+    q_data = [{"body": str(i), "done": False} for i in range(5)]
+    q_data.append({"body": "end", "done": True})
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = q_data + [queue.Empty()]
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch(
+            "api_utils.utils_ext.stream.detect_function_calls_from_dom",
+            new_callable=AsyncMock,
+            return_value=([], ""),
+        ),
+    ):
+        chunks = [chunk async for chunk in use_stream_response("req1", page=page)]
+
+    assert len(chunks) == 6
+    scripts = [c.args[0] for c in page.evaluate.call_args_list]
+    assert scripts.count(_SCROLL_CALL_JS) == 1
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_throttles_scroll_while_idle():
+    """
+    Test scenario: Queue stays empty until the TTFB timeout
+    Expected: Scroll helper runs only every few wait ticks
+    """
+    from api_utils.utils_ext.stream import _IDLE_SCROLL_INTERVAL_TICKS, _SCROLL_CALL_JS
+
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = queue.Empty
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch.object(state, "page_instance", None),
+        patch("asyncio.sleep", new_callable=AsyncMock),
+    ):
+        chunks = [chunk async for chunk in use_stream_response("req1", page=page)]
+
+    assert chunks[-1]["reason"] == "ttfb_timeout"
+    ticks = mock_queue.get_nowait.call_count
+    scroll_calls = [
+        c for c in page.evaluate.call_args_list if c.args[0] == _SCROLL_CALL_JS
+    ]
+    assert 0 < len(scroll_calls) <= ticks // _IDLE_SCROLL_INTERVAL_TICKS + 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_queue_data_wakes_on_incoming_item():
+    """
+    Test scenario: Waiting on a real multiprocessing.Queue pipe
+    Expected: Times out while empty, wakes as soon as an item is put
+    """
+    import multiprocessing
+
+    from api_utils.utils_ext.stream import _queue_reader_fd, _wait_for_queue_data
+
+    mp_queue = multiprocessing.Queue()
+    try:
+        fd = _queue_reader_fd(mp_queue)
+        assert isinstance(fd, int)
+        assert await _wait_for_queue_data(fd, 0.01) is False
+
+        mp_queue.put({"body": "x"})
+        assert await _wait_for_queue_data(fd, 5.0) is True
+        assert mp_queue.get_nowait() == {"body": "x"}
+    finally:
+        mp_queue.close()
+        mp_queue.join_thread()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_queue_data_without_fd_sleeps():
+    """
+    Test scenario: Queue has no usable reader fd (mocked queue)
+    Expected: Falls back to a plain sleep
+    """
+    from api_utils.utils_ext.stream import _queue_reader_fd, _wait_for_queue_data
+
+    assert _queue_reader_fd(MagicMock()) is None
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        assert await _wait_for_queue_data(None, 0.1) is False
+    mock_sleep.assert_awaited_once_with(0.1)
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_thinking_only_falls_back_to_dom():
+    """
+    Test scenario: Stream ends with reasoning but no body text
+    Expected: Body is recovered from the DOM and yielded after the done chunk
+    """
+    q_data = [
+        json.dumps({"reason": "Thinking", "body": "", "done": False}),
+        json.dumps({"reason": "Thinking more", "body": "", "done": True}),
+    ]
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = q_data + [queue.Empty()]
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+    controller = MagicMock()
+    controller.wait_for_body_text = AsyncMock(return_value="DOM answer")
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        patch(
+            "api_utils.utils_ext.stream.detect_function_calls_from_dom",
+            new_callable=AsyncMock,
+            return_value=([], ""),
+        ),
+        patch("browser_utils.page_controller.PageController", return_value=controller),
+    ):
+        chunks = [chunk async for chunk in use_stream_response("req1", page=page)]
+
+    assert chunks[1]["done"] is True
+    assert chunks[-1] == {"body": "DOM answer", "reason": "", "done": False}
+    controller.wait_for_body_text.assert_awaited_once_with(timeout_ms=10000)
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_unwraps_dict_payloads():
+    """
+    Test scenario: Proxy enqueues {"ts", "data"} dicts without JSON encoding
+    Expected: Stale wrappers are dropped, fresh ones are unwrapped
+    """
+    now = time.time()
+    q_data = [
+        {"ts": now - 3600, "data": {"body": "stale", "done": False}},
+        {"ts": now, "data": {"body": "fresh", "done": False}},
+        {"ts": now, "data": {"body": "fresh", "done": True}},
+    ]
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = q_data + [queue.Empty()]
+
+    with patch.object(state, "STREAM_QUEUE", mock_queue), patch.object(state, "logger"):
+        chunks = [
+            chunk
+            async for chunk in use_stream_response("req1", stream_start_time=now - 1)
+        ]
+
+    assert [c["body"] for c in chunks] == ["fresh", "fresh"]
+    assert chunks[-1]["done"] is True
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_dict_error_payload_raises():
+    """
+    Test scenario: Proxy enqueues an error dict (which also carries done=True)
+    Expected: Raised as an upstream error, not treated as an explicit DONE
+    """
+    error_data = {"error": True, "status": 500, "message": "boom", "done": True}
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = [error_data, queue.Empty()]
+
+    with patch.object(state, "STREAM_QUEUE", mock_queue), patch.object(state, "logger"):
+        with pytest.raises(UpstreamError):
+            async for _ in use_stream_response("req1"):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_reuses_ui_check_locators():
+    """
+    Test scenario: Stream times out after data, running UI checks repeatedly
+    Expected: Stop/submit locators are created once and reused
+    """
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = [
+        json.dumps({"body": "some data", "done": False})
+    ] + [queue.Empty] * 1000
+    locator = MagicMock()
+    locator.is_visible = AsyncMock(return_value=False)
+    locator.count = AsyncMock(return_value=0)
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+    page.locator.return_value = locator
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        # Waits are mocked out, so disable the wall-clock probe TTL
+        patch.object(stream_module, "_UI_PROBE_TTL", 0.0),
+    ):
+        chunks = [
+            chunk
+            async for chunk in use_stream_response(
+                "req1", timeout=10.0, silence_threshold=5.0, page=page
+            )
+        ]
+
+    assert chunks[-1]["reason"] in ["internal_timeout", "hard_timeout"]
+    assert locator.is_visible.await_count >= 2
+    assert page.locator.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_timeout_reuses_periodic_ui_probe():
+    """
+    Test scenario: The stream times out while the UI is idle
+    Expected: The timeout path reuses the periodic UI probe result
+    """
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = [
+        json.dumps({"body": "some data", "done": False})
+    ] + [queue.Empty] * 1000
+    locator = MagicMock()
+    locator.is_visible = AsyncMock(return_value=False)
+    locator.count = AsyncMock(return_value=0)
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+    page.locator.return_value = locator
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        # Waits are mocked out, so disable the wall-clock probe TTL
+        patch.object(stream_module, "_UI_PROBE_TTL", 0.0),
+    ):
+        chunks = [
+            chunk
+            async for chunk in use_stream_response(
+                "req1", timeout=6.0, silence_threshold=6.0, page=page
+            )
+        ]
+
+    assert chunks[-1]["reason"] == "internal_timeout"
+    # Probed once after 30 empty ticks; the timeout at 60 reuses that result
+    assert locator.is_visible.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_snoozes_while_ui_active():
+    """
+    Test scenario: The UI is generating at the first timeouts, then goes idle
+    Expected: Each snooze is followed by a fresh probe before timing out
+    """
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = [
+        json.dumps({"body": "some data", "done": False})
+    ] + [queue.Empty] * 1000
+    locator = MagicMock()
+    locator.is_visible = AsyncMock(side_effect=[True, True, False])
+    locator.count = AsyncMock(return_value=0)
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+    page.locator.return_value = locator
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger") as mock_logger,
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        # Waits are mocked out, so disable the wall-clock probe TTL
+        patch.object(stream_module, "_UI_PROBE_TTL", 0.0),
+    ):
+        chunks = [
+            chunk
+            async for chunk in use_stream_response(
+                "req1", timeout=6.0, silence_threshold=6.0, page=page
+            )
+        ]
+
+    assert chunks[-1]["reason"] == "internal_timeout"
+    assert locator.is_visible.await_count == 3
+    snoozes = [c for c in mock_logger.warning.call_args_list if "Snoozing" in str(c)]
+    assert len(snoozes) == 2
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_ui_probe_ttl():
+    """
+    Test scenario: Periodic UI checks fire faster than the probe TTL
+    Expected: The page is probed once and the result reused within the TTL
+    """
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = [
+        json.dumps({"body": "some data", "done": False})
+    ] + [queue.Empty] * 1000
+    locator = MagicMock()
+    locator.is_visible = AsyncMock(return_value=False)
+    locator.count = AsyncMock(return_value=0)
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=True)
+    page.locator.return_value = locator
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch("asyncio.sleep", new_callable=AsyncMock),
+        patch.object(stream_module, "_UI_PROBE_TTL", 3600.0),
+    ):
+        chunks = [
+            chunk
+            async for chunk in use_stream_response(
+                "req1", timeout=10.0, silence_threshold=5.0, page=page
+            )
+        ]
+
+    assert chunks[-1]["reason"] == "internal_timeout"
+    assert locator.is_visible.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_use_stream_response_aborts_on_global_shutdown():
+    """
+    Test scenario: Global shutdown event is set while streaming
+    Expected: Stream ends with a global_shutdown done chunk
+    """
+    import threading
+
+    from config.global_state import GlobalState
+
+    shutdown = threading.Event()
+    shutdown.set()
+    mock_queue = MagicMock()
+    mock_queue.get_nowait.side_effect = queue.Empty
+
+    with (
+        patch.object(state, "STREAM_QUEUE", mock_queue),
+        patch.object(state, "logger"),
+        patch.object(GlobalState, "IS_SHUTTING_DOWN", shutdown),
+    ):
+        chunks = [chunk async for chunk in use_stream_response("req1")]
+
+    assert chunks == [
+        {"done": True, "reason": "global_shutdown", "body": "", "function": []}
+    ]
+
+
+def test_apply_boundary_cumulative_and_delta_packets():
+    """
+    Test scenario: Packets carry either cumulative text or deltas
+    Expected: Both are folded into the same accumulated text
+    """
+    stream_state = StreamState()
+
+    assert _apply_boundary("Think", "", stream_state) == ("Think", "", False)
+    assert _apply_boundary("Thinking", "", stream_state) == ("Thinking", "", False)
+    assert _apply_boundary(" more", "Hi", stream_state) == (
+        "Thinking more",
+        "Hi",
+        False,
+    )
+    assert stream_state.force_body_mode is False
+
+
+def test_apply_boundary_splits_at_tool_structure():
+    """
+    Test scenario: A tool tag appears in the reason stream, split across packets
+    Expected: Reason is cut at the tag and the rest is routed to the body
+    """
+    stream_state = StreamState()
+
+    _apply_boundary("Let me check.", "", stream_state)
+    assert _apply_boundary(" If a < b", "", stream_state)[2] is False
+    reason, body, split_applied = _apply_boundary("\n<tool_call>{", "", stream_state)
+    assert split_applied is True
+    assert reason == "Let me check. If a < b"
+    assert body == "\n<tool_call>{"
+
+    reason, body, split_applied = _apply_boundary('"a": 1}', "", stream_state)
+    assert split_applied is False
+    assert reason == "Let me check. If a < b"
+    assert reason is stream_state.thought_part
+    assert body == '\n<tool_call>{"a": 1}'
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "plain reasoning",
+        "<tool_call>{",
+        "Let me check.\n<tool_call>{",
+        "Let me check.\n  ```xml\n<invoke name='x'>",
+        "inline ```xml <tag> without newline",
+        "a < b and c<d then\n<e f",
+        "\n" * 60 + "  <",
+        "\n\t<tag",
+        "\n<tag",
+    ],
+)
+def test_find_tool_structure_matches_pattern(text):
+    """
+    Test scenario: Hand scanner against the reference regex
+    Expected: Same match start (or -1) for fixed edge cases
+    """
+    from api_utils.utils_ext.stream import TOOL_STRUCTURE_PATTERN, find_tool_structure
+
+    match = TOOL_STRUCTURE_PATTERN.search(text)
+    assert find_tool_structure(text) == (match.start() if match else -1)
+
+
+def test_find_tool_structure_matches_pattern_random():
+    """
+    Test scenario: Hand scanner against the reference regex on random text
+    Expected: Same match start (or -1) for every sample
+    """
+    import random
+
+    from api_utils.utils_ext.stream import TOOL_STRUCTURE_PATTERN, find_tool_structure
+
+    rng = random.Random(0)
+    alphabet = list("ab<>`\n \t_-9") + ["```", "```py", "\n<tool ", "<a>"]
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        match = TOOL_STRUCTURE_PATTERN.search(text)
+        assert find_tool_structure(text) == (match.start() if match else -1), text
+
+
 @pytest.mark.asyncio
 async def test_clear_stream_queue_exception_during_clear():
     """
@@ -1,12 +1,20 @@
 import json
 import unittest
+from collections import OrderedDict
+from unittest.mock import patch
 
 from api_utils.utils_ext.function_calling import (
+    CallIdManager,
+    FunctionCallingConfig,
     FunctionCallingMode,
+    OpenAIFunctionCall,
+    OpenAIToolCall,
+    OpenAIToolCallDelta,
     ParsedFunctionCall,
     ResponseFormatter,
     SchemaConversionError,
     SchemaConverter,
+    _config_from_settings,
 )
 from api_utils.utils_ext.function_calling_orchestrator import (
     FunctionCallingState,
@@ -83,7 +91,8 @@ class TestFunctionCallingCore(unittest.TestCase):
             },
         }
         result = self.converter.convert_tool(openai_tool)
-        assert result is not None, "convert_tool returned None"
+        if result is None:
+            self.fail("convert_tool returned None")
         self.assertNotIn("strict", result)
         self.assertNotIn("strict", result["parameters"])
         self.assertEqual(result["name"], "get_weather")
@@ -181,7 +190,8 @@ class TestFunctionCallingCore(unittest.TestCase):
             },
         }
         result = self.converter.convert_tool(openai_tool)
-        assert result is not None, "convert_tool returned None"
+        if result is None:
+            self.fail("convert_tool returned None")
         prop = result["parameters"]["properties"]["value"]
         # oneOf is NOT supported by AI Studio - flattened to first type
         self.assertNotIn("oneOf", prop)
@@ -265,6 +275,35 @@ class TestFunctionCallingCore(unittest.TestCase):
         self.assertNotIn("const", status_schema)
         self.assertEqual(status_schema["enum"], ["active"])
 
+    def test_schema_converter_cleans_deep_schemas_without_recursion(self):
+        """Test that nesting deeper than the recursion limit is still cleaned."""
+        import sys
+
+        depth = sys.getrecursionlimit() + 100
+        schema = leaf = {"type": "string", "title": "leaf"}
+        for _ in range(depth):
+            schema = {"type": "array", "items": schema, "default": []}
+
+        cleaned = self.converter._clean_parameters(schema)
+
+        for _ in range(depth):
+            self.assertEqual(set(cleaned), {"type", "items"})
+            cleaned = cleaned["items"]
+        self.assertEqual(cleaned, {"type": "string"})
+        self.assertIn("title", leaf)
+
+    def test_schema_converter_rejects_cyclic_schema(self):
+        """Test that a self-referencing schema raises instead of looping."""
+        schema = {"type": "object", "properties": {}}
+        schema["properties"]["self"] = schema
+
+        with self.assertRaises(SchemaConversionError):
+            self.converter._clean_parameters(schema)
+        with self.assertRaises(SchemaConversionError):
+            self.converter.convert_tool(
+                {"type": "function", "function": {"name": "f", "parameters": schema}}
+            )
+
     def test_schema_converter_invalid_input(self):
         """Test SchemaConverter handles invalid inputs gracefully."""
         # Not a dict - returns None
@@ -279,6 +318,17 @@ class TestFunctionCallingCore(unittest.TestCase):
             self.converter.convert_tool({"type": "web_search", "function": {}})
         )
 
+    def test_schema_converter_convert_tools_reports_failing_index(self):
+        """Test that convert_tools names the index of the invalid tool."""
+        tools = [
+            {"type": "function", "function": {"name": "ok"}},
+            {"type": "web_search"},
+            {"type": "function", "function": {"description": "no name"}},
+        ]
+
+        with self.assertRaisesRegex(SchemaConversionError, "tool at index 2"):
+            self.converter.convert_tools(tools)
+
     def test_schema_converter_flat_format(self):
         """Test conversion of flat tool definition (e.g. from opencode)."""
         flat_tool = {
@@ -323,6 +373,170 @@ class TestFunctionCallingCore(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["name"], "valid_func")
 
+    def test_schema_converter_non_function_tool_skips_cache(self):
+        """Test that non-function tools are dropped before the cache is consulted."""
+        tool = {"type": "web_search", "filters": {"allowed_domains": ["google.com"]}}
+        with patch(
+            "api_utils.utils_ext.function_calling._conversion_cache", OrderedDict()
+        ) as cache:
+            self.assertIsNone(self.converter.convert_tool(tool))
+        self.assertEqual(len(cache), 0)
+
+    def test_schema_converter_shares_compliant_parameters(self):
+        """Test that already-compliant parameters are reused without copying."""
+        parameters = {
+            "type": "object",
+            "properties": {
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "note": {"type": "string", "nullable": True, "maxLength": 10},
+            },
+            "required": ["tags"],
+        }
+        tool = {"type": "function", "function": {"name": "f", "parameters": parameters}}
+
+        self.assertFalse(self.converter._needs_cleaning(parameters))
+        self.assertEqual(self.converter._clean_parameters(parameters), parameters)
+        self.assertIs(self.converter._convert_tool(tool)["parameters"], parameters)
+
+    def test_schema_converter_convert_tool_is_memoized(self):
+        """Test that repeated conversions hit the cache and return fresh dicts."""
+        tool = {
+            "type": "function",
+            "function": {"name": "memo_tool", "parameters": {"type": "object"}},
+        }
+
+        with (
+            patch(
+                "api_utils.utils_ext.function_calling._conversion_cache", OrderedDict()
+            ),
+            patch.object(
+                SchemaConverter, "_convert_tool", wraps=self.converter._convert_tool
+            ) as convert,
+        ):
+            first = self.converter.convert_tool(tool)
+            first["parameters"]["type"] = "mutated"
+            second = self.converter.convert_tool(json.loads(json.dumps(tool)))
+
+        self.assertEqual(convert.call_count, 1)
+        self.assertEqual(second["parameters"], {"type": "object"})
+        self.assertEqual(tool["function"]["parameters"], {"type": "object"})
+
+    def test_schema_converter_preserves_property_order(self):
+        """Test that converted schemas keep the client's key order, cached or not."""
+        parameters = {
+            "type": "object",
+            "properties": {
+                "zeta": {
+                    "type": "object",
+                    "title": "Zeta",
+                    "properties": {"z": {"type": "string"}, "a": {"type": "string"}},
+                },
+                "alpha": {"type": "string"},
+                "mid": {"type": "integer"},
+            },
+            "required": ["zeta"],
+        }
+        tool = {"type": "function", "function": {"name": "f", "parameters": parameters}}
+        reordered = {
+            "type": "function",
+            "function": {
+                "name": "f",
+                "parameters": {
+                    **parameters,
+                    "properties": dict(reversed(parameters["properties"].items())),
+                },
+            },
+        }
+
+        with patch(
+            "api_utils.utils_ext.function_calling._conversion_cache", OrderedDict()
+        ):
+            for _ in range(2):
+                properties = self.converter.convert_tool(tool)["parameters"][
+                    "properties"
+                ]
+                self.assertEqual(list(properties), ["zeta", "alpha", "mid"])
+                self.assertEqual(list(properties["zeta"]["properties"]), ["z", "a"])
+            reordered_properties = self.converter.convert_tool(reordered)["parameters"][
+                "properties"
+            ]
+
+        self.assertEqual(list(reordered_properties), ["mid", "alpha", "zeta"])
+
+    def test_schema_converter_cache_respects_type_case_setting(self):
+        """Test that toggling uppercase types does not return stale conversions."""
+        tool = {
+            "type": "function",
+            "function": {"name": "case_tool", "parameters": {"type": "object"}},
+        }
+
+        lower = self.converter.convert_tool(tool)
+        with patch("config.settings.FUNCTION_CALLING_UPPERCASE_TYPES", True):
+            upper = self.converter.convert_tool(tool)
+
+        self.assertEqual(lower["parameters"]["type"], "object")
+        self.assertEqual(upper["parameters"]["type"], "OBJECT")
+
+    def test_schema_converter_needs_cleaning_detects_changes(self):
+        """Test that any schema _clean_parameters would modify is flagged."""
+        schemas = [
+            {"type": "object", "additionalProperties": False},
+            {"type": "OBJECT"},
+            {"type": ["string", "null"]},
+            {"properties": {"a": {"type": "string", "title": "A"}}},
+            {"items": {"anyOf": [{"type": "string"}]}},
+            {"items": [{"type": "string"}]},
+            {"properties": "bad"},
+            {"type": "string", "nullable": "yes"},
+            {"const": "x"},
+        ]
+        for schema in schemas:
+            with self.subTest(schema=schema):
+                self.assertTrue(self.converter._needs_cleaning(schema))
+                self.assertNotEqual(self.converter._clean_parameters(schema), schema)
+
+    def test_schema_converter_to_json_string(self):
+        """Test to_json_string output for pretty, compact and custom indents."""
+        declarations = [{"name": "café", "parameters": {"type": "object"}}]
+
+        self.assertEqual(
+            self.converter.to_json_string(declarations),
+            json.dumps(declarations, indent=2, ensure_ascii=False),
+        )
+        self.assertEqual(
+            self.converter.to_json_string(declarations, indent=None),
+            json.dumps(declarations, ensure_ascii=False),
+        )
+        self.assertEqual(
+            self.converter.to_json_string(declarations, indent=4),
+            json.dumps(declarations, indent=4, ensure_ascii=False),
+        )
+
+    def test_response_formatter_arguments_match_json_dumps(self):
+        """Test that tool call arguments keep the json.dumps wire format."""
+        arguments = {"city": "Zürich", "days": [1, 2], "ratio": float("nan")}
+        parsed_call = ParsedFunctionCall(name="forecast", arguments=arguments)
+        expected = json.dumps(arguments, ensure_ascii=False)
+
+        result = self.formatter.format_tool_call(parsed_call, call_id="call_x")
+        chunks = self.formatter.format_streaming_chunks(0, parsed_call, chunk_size=7)
+
+        self.assertEqual(result["function"]["arguments"], expected)
+        self.assertEqual(
+            "".join(chunk["function"].get("arguments", "") for chunk in chunks),
+            expected,
+        )
+
+    def test_response_formatter_arguments_with_non_string_keys(self):
+        """Test that non-string keys and wide integers serialize like json.dumps."""
+        parsed_call = ParsedFunctionCall(name="f", arguments={1: "a", "big": 2**70})
+
+        result = self.formatter.format_tool_call(parsed_call, call_id="call_x")
+
+        self.assertEqual(
+            json.loads(result["function"]["arguments"]), {"1": "a", "big": 2**70}
+        )
+
     def test_response_formatter_format_tool_call(self):
         """Test formatting a single ParsedFunctionCall to OpenAI tool_call format."""
         parsed_call = ParsedFunctionCall(
@@ -341,6 +555,24 @@ class TestFunctionCallingCore(unittest.TestCase):
             {"location": "San Francisco, CA"},
         )
 
+    def test_response_formatter_format_tool_call_matches_schema(self):
+        """Test that the hand-built tool_call dict matches the OpenAIToolCall schema."""
+        parsed_call = ParsedFunctionCall(name="search", arguments={"q": "ü"})
+
+        result = self.formatter.format_tool_call(parsed_call, call_id="call_x")
+
+        expected = OpenAIToolCall(
+            id="call_x",
+            function=OpenAIFunctionCall(name="search", arguments='{"q": "ü"}'),
+        )
+        self.assertEqual(result, expected.to_dict())
+
+    def test_tool_call_delta_to_dict_omits_unset_fields(self):
+        """Test that OpenAIToolCallDelta.to_dict only emits set fields."""
+        delta = OpenAIToolCallDelta(index=1, function={"arguments": "{}"})
+
+        self.assertEqual(delta.to_dict(), {"index": 1, "function": {"arguments": "{}"}})
+
     def test_response_formatter_auto_id_generation(self):
         """Test that ResponseFormatter generates unique IDs if not provided."""
         parsed_call = ParsedFunctionCall(name="test_func", arguments={})
@@ -351,6 +583,41 @@ class TestFunctionCallingCore(unittest.TestCase):
         self.assertTrue(result2["id"].startswith("call_"))
         self.assertNotEqual(result1["id"], result2["id"])
 
+    def test_call_id_manager_id_format(self):
+        """Test that generated call IDs are call_ followed by 24 hex chars."""
+        call_id = CallIdManager().generate_id()
+
+        self.assertRegex(call_id, r"^call_[0-9a-f]{24}$")
+
+    def test_call_id_manager_evicts_oldest_pending_calls(self):
+        """Test that pending calls are bounded by MAX_PENDING_CALLS."""
+        manager = CallIdManager()
+        manager.MAX_PENDING_CALLS = 2
+
+        manager.register_call("call_1", "f", {})
+        manager.register_call("call_2", "f", {})
+        manager.register_call("call_1", "f", {"again": True})
+        manager.register_call("call_3", "f", {})
+
+        self.assertIsNone(manager.get_pending_call("call_2"))
+        self.assertEqual(
+            [c.call_id for c in manager.get_pending_calls()], ["call_1", "call_3"]
+        )
+
+    def test_call_id_manager_register_call_non_str_name(self):
+        """Test that non-str function names are stored without interning."""
+
+        class Name(str):
+            pass
+
+        manager = CallIdManager()
+
+        subclass_call = manager.register_call("call_1", Name("f"), {})
+        none_call = manager.register_call("call_2", None, {})  # type: ignore[arg-type]
+
+        self.assertEqual(subclass_call.function_name, "f")
+        self.assertIsNone(none_call.function_name)
+
     def test_response_formatter_format_tool_calls(self):
         """Test formatting multiple parsed calls at once."""
         parsed_calls = [
@@ -387,13 +654,104 @@ class TestFunctionCallingCore(unittest.TestCase):
         self.assertIn("arguments", chunks[1]["function"])
 
         # Combine all argument fragments
-        combined_args = ""
-        for chunk in chunks:
-            if "function" in chunk and "arguments" in chunk["function"]:
-                combined_args += chunk["function"]["arguments"]
+        combined_args = "".join(
+            chunk["function"]["arguments"]
+            for chunk in chunks
+            if "arguments" in chunk.get("function", {})
+        )
 
         self.assertEqual(json.loads(combined_args), {"location": "SF"})
 
+    def test_response_formatter_streaming_chunks_match_generic_delta(self):
+        """Test that streaming chunks match what format_tool_call_delta builds."""
+        parsed_call = ParsedFunctionCall(name="f", arguments={"text": "x" * 12})
+
+        chunks = self.formatter.format_streaming_chunks(
+            index=2, parsed_call=parsed_call, chunk_size=7
+        )
+        call_id = chunks[0]["id"]
+
+        self.assertEqual(
+            chunks[0],
+            self.formatter.format_tool_call_delta(2, call_id, function_name="f"),
+        )
+        for chunk in chunks[1:]:
+            fragment = chunk["function"]["arguments"]
+            self.assertEqual(
+                chunk,
+                self.formatter.format_tool_call_delta(
+                    2, call_id, arguments_fragment=fragment
+                ),
+            )
+
+    def test_response_formatter_streaming_chunks_keep_multibyte_chars(self):
+        """Test that argument chunks never split non-ASCII characters."""
+        arguments = {"city": "Zürich 東京 🌧"}
+        parsed_call = ParsedFunctionCall(name="weather", arguments=arguments)
+
+        chunks = self.formatter.format_streaming_chunks(
+            index=0, parsed_call=parsed_call, chunk_size=3
+        )
+
+        fragments = [c["function"]["arguments"] for c in chunks[1:]]
+        self.assertTrue(all(0 < len(f) <= 3 for f in fragments))
+        self.assertEqual(json.loads("".join(fragments)), arguments)
+
+    def test_response_formatter_streaming_chunks_json_match_dicts(self):
+        """Test that pre-serialized chunks equal the encoded dict chunks."""
+        parsed_call = ParsedFunctionCall(
+            name="say", arguments={"text": 'Grüße "quoted"\n\\ 🌧', "n": 1.5}
+        )
+
+        with patch.object(
+            self.formatter.id_manager, "generate_id", return_value="call_fixed"
+        ):
+            dict_chunks = self.formatter.format_streaming_chunks(
+                index=1, parsed_call=parsed_call, chunk_size=4
+            )
+            json_chunks = self.formatter.format_streaming_chunks_json(
+                index=1, parsed_call=parsed_call, chunk_size=4
+            )
+
+        self.assertEqual(
+            json_chunks,
+            [
+                json.dumps(c, ensure_ascii=False, separators=(",", ":"))
+                for c in dict_chunks
+            ],
+        )
+
+
+class TestFunctionCallingConfig(unittest.TestCase):
+    """Test FunctionCallingConfig.from_settings caching."""
+
+    def tearDown(self):
+        _config_from_settings.cache_clear()
+
+    def test_from_settings_is_cached(self):
+        """Repeated calls return the same frozen instance."""
+        _config_from_settings.cache_clear()
+
+        first = FunctionCallingConfig.from_settings()
+
+        self.assertIs(FunctionCallingConfig.from_settings(), first)
+        with self.assertRaises(AttributeError):
+            first.debug = not first.debug  # type: ignore[misc]
+
+    def test_cache_clear_rereads_settings(self):
+        """Clearing the cache picks up changed settings."""
+        _config_from_settings.cache_clear()
+        with patch("config.settings.FUNCTION_CALLING_MODE", "native"):
+            self.assertEqual(
+                FunctionCallingConfig.from_settings().mode, FunctionCallingMode.NATIVE
+            )
+        _config_from_settings.cache_clear()
+        with patch("config.settings.FUNCTION_CALLING_MODE", "bogus"):
+            self.assertEqual(
+                FunctionCallingConfig.from_settings().mode,
+                FunctionCallingMode.EMULATED,
+            )
+
 
 class TestAutoModeFallback(unittest.TestCase):
     """Test AUTO mode fallback logic for should_skip_tool_injection."""
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from browser_utils.initialization.network import (
+    MODEL_LIST_URL_PATTERN,
     _modify_model_list_response,
     _setup_model_list_interception,
     setup_network_interception_and_scripts,
@@ -66,6 +67,47 @@ async def test_route_handler_registered():
     assert callable(mock_context.route.call_args[0][1])
 
 
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://alkalimakersuite-pa.clients6.google.com/$rpc/"
+            "google.internal.alkali.applications.makersuite.v1.MakerSuiteService/ListModels",
+            True,
+        ),
+        ("https://aistudio.google.com/static/app.js", False),
+        (
+            "https://alkalimakersuite-pa.clients6.google.com/$rpc/"
+            "google.internal.alkali.applications.makersuite.v1.MakerSuiteService/GenerateContent",
+            False,
+        ),
+    ],
+)
+def test_model_list_url_pattern(url, expected):
+    """Only the ListModels endpoint is routed through the interceptor"""
+    assert bool(MODEL_LIST_URL_PATTERN.search(url)) is expected
+
+
+@pytest.mark.asyncio
+async def test_route_handler_fulfills_with_modified_body():
+    """Test the handler fetches, rewrites and fulfills the model list response"""
+    mock_context = AsyncMock()
+    await _setup_model_list_interception(mock_context)
+    pattern, handler = mock_context.route.call_args[0]
+    assert pattern is MODEL_LIST_URL_PATTERN
+
+    route = AsyncMock()
+    route.request.url = "https://alkalimakersuite-pa.clients6.google.com/ListModels"
+    response = AsyncMock()
+    response.body.return_value = b'{"a":1}'
+    route.fetch.return_value = response
+
+    await handler(route)
+
+    route.fulfill.assert_awaited_once_with(response=response, body=b'{"a":1}')
+    route.continue_.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_modify_response_anti_hijack_prefix():
     """Test anti-hijack prefix handling"""
@@ -137,3 +179,15 @@ async def test_modify_response_json_decode_error():
     result = await _modify_model_list_response(invalid_json_body, "https://example.com")
 
     assert result == invalid_json_body
+
+
+@pytest.mark.asyncio
+async def test_modify_response_compact_utf8():
+    """Test the body is re-serialized as compact UTF-8 JSON with the prefix kept"""
+    body = b')]}\'\n{"models": [["models/gemini", "Gemini \xc3\xa9"]]}'
+
+    result = await _modify_model_list_response(body, "https://example.com")
+
+    assert result.startswith(b")]}'\n")
+    assert json.loads(result[5:]) == {"models": [["models/gemini", "Gemini é"]]}
+    assert result[5:] == '{"models":[["models/gemini","Gemini é"]]}'.encode("utf-8")
@@ -140,11 +140,13 @@ async def test_submit_prompt_success(
     ):
         await input_controller.submit_prompt("Hello World", [], mock_check_disconnect)
 
-        # Verify text filled
-        assert prompt_area.evaluate.called
-        assert (
-            autosize.first.evaluate.called
-        )  # Changed: first.evaluate instead of evaluate
+        # Verify text filled and mirrored to the autosize wrapper in one call
+        prompt_area.evaluate.assert_awaited_once()
+        script, args = prompt_area.evaluate.call_args[0]
+        assert "data-value" in script
+        assert args[0] == "Hello World"
+        assert all("text-wrapper" in sel or "autosize" in sel for sel in args[1:])
+        autosize.count.assert_not_called()
         # Verify submit button wait
         assert submit_btn.is_enabled.called
         # Verify click
@@ -22,10 +22,16 @@ def mock_page():
     locator_mock.input_value.return_value = "0.5"
     locator_mock.get_attribute.return_value = "false"
     locator_mock.count.return_value = 0
+    locator_mock.evaluate_all.return_value = None
     page.locator.return_value = locator_mock
     return page
 
 
+def toggle_state(checked, visible=True, disabled=False):
+    """State dict returned by the fused toggle read."""
+    return {"visible": visible, "checked": checked, "disabled": disabled}
+
+
 @pytest.fixture
 def mock_logger():
     return MagicMock()
@@ -296,7 +302,7 @@ async def test_ensure_tools_panel_already_expanded(
 async def test_open_url_content(controller, mock_check_disconnect, mock_page):
     # Setup: switch is off
     switch = AsyncMock()
-    switch.get_attribute.return_value = "false"
+    switch.evaluate_all.return_value = toggle_state(checked=False)
     mock_page.locator.return_value = switch
 
     await controller._open_url_content(mock_check_disconnect)
@@ -330,17 +336,9 @@ async def test_adjust_google_search(controller, mock_check_disconnect, mock_page
     request_params = {"tools": [{"function": {"name": "googleSearch"}}]}
 
     toggle = AsyncMock()
-    # Mock get_attribute for all calls in _adjust_google_search:
-    # 1. "aria-checked" -> "false" (initial check)
-    # 2. "disabled" -> None (toggle is not disabled)
-    # 3. "class" -> "" (no disabled class)
-    # 4. "aria-checked" -> "true" (after click verification)
-    toggle.get_attribute.side_effect = [
-        "false",  # Initial aria-checked check
-        None,  # disabled attribute check
-        "",  # class attribute check
-        "true",  # aria-checked after click
-    ]
+    # Initial state read in one round-trip; aria-checked re-read after click
+    toggle.evaluate_all.return_value = toggle_state(checked=False)
+    toggle.get_attribute.return_value = "true"
     mock_page.locator.return_value = toggle
 
     # Mock _supports_google_search to return True so the function doesn't skip early
@@ -946,7 +944,7 @@ async def test_ensure_tools_panel_expanded_client_disconnected(
 async def test_open_url_content_exception(controller, mock_check_disconnect, mock_page):
     """Test URL content exception handling (lines 610-615)."""
     switch = AsyncMock()
-    switch.get_attribute.side_effect = Exception("Playwright error")
+    switch.evaluate_all.side_effect = Exception("Playwright error")
     mock_page.locator.return_value = switch
 
     # Should not raise, just log error
@@ -959,7 +957,7 @@ async def test_open_url_content_cancelled_error(
 ):
     """Test URL content CancelledError is re-raised (line 611-612)."""
     switch = AsyncMock()
-    switch.get_attribute.side_effect = asyncio.CancelledError()
+    switch.evaluate_all.side_effect = asyncio.CancelledError()
     mock_page.locator.return_value = switch
 
     with pytest.raises(asyncio.CancelledError):
@@ -972,7 +970,7 @@ async def test_open_url_content_client_disconnected(
 ):
     """Test URL content ClientDisconnectedError is re-raised (lines 614-615)."""
     switch = AsyncMock()
-    switch.get_attribute.side_effect = ClientDisconnectedError("test_req", "test stage")
+    switch.evaluate_all.side_effect = ClientDisconnectedError("test_req", "test stage")
     mock_page.locator.return_value = switch
 
     with pytest.raises(ClientDisconnectedError):
@@ -1003,6 +1001,7 @@ async def test_adjust_google_search_toggle_not_visible(
     """Test Google Search when toggle not visible (AssertionError case, lines 715-716)."""
     request_params = {}
     toggle = AsyncMock()
+    toggle.evaluate_all.return_value = toggle_state(checked=False, visible=False)
     mock_page.locator.return_value = toggle
 
     with (
@@ -1028,7 +1027,7 @@ async def test_adjust_google_search_general_exception(
     """Test Google Search general exception (lines 717-718)."""
     request_params = {}
     toggle = AsyncMock()
-    toggle.get_attribute.side_effect = RuntimeError("Unexpected error")
+    toggle.evaluate_all.side_effect = RuntimeError("Unexpected error")
     mock_page.locator.return_value = toggle
 
     with patch.object(controller, "_supports_google_search", return_value=True):
@@ -1045,7 +1044,7 @@ async def test_adjust_google_search_cancelled_error(
     """Test Google Search CancelledError is re-raised (line 711-712)."""
     request_params = {}
     toggle = AsyncMock()
-    toggle.get_attribute.side_effect = asyncio.CancelledError()
+    toggle.evaluate_all.side_effect = asyncio.CancelledError()
     mock_page.locator.return_value = toggle
 
     with patch.object(controller, "_supports_google_search", return_value=True):
@@ -1062,7 +1061,7 @@ async def test_adjust_google_search_client_disconnected(
     """Test Google Search ClientDisconnectedError is re-raised (lines 719-720)."""
     request_params = {}
     toggle = AsyncMock()
-    toggle.get_attribute.side_effect = ClientDisconnectedError("test_req", "test stage")
+    toggle.evaluate_all.side_effect = ClientDisconnectedError("test_req", "test stage")
     mock_page.locator.return_value = toggle
 
     with patch.object(controller, "_supports_google_search", return_value=True):
@@ -1080,17 +1079,9 @@ async def test_adjust_google_search_update_failed(
     request_params = {"tools": [{"function": {"name": "googleSearch"}}]}
 
     toggle = AsyncMock()
-    # Mock get_attribute for all calls:
-    # 1. "aria-checked" -> "false" (initial check)
-    # 2. "disabled" -> None (toggle is not disabled)
-    # 3. "class" -> "" (no disabled class)
-    # 4. "aria-checked" -> "false" (after click - update failed, stays off)
-    toggle.get_attribute.side_effect = [
-        "false",  # Initial aria-checked check
-        None,  # disabled attribute check
-        "",  # class attribute check
-        "false",  # aria-checked after click (update failed)
-    ]
+    # Off before the click, and still off after it (update failed)
+    toggle.evaluate_all.return_value = toggle_state(checked=False)
+    toggle.get_attribute.return_value = "false"
     mock_page.locator.return_value = toggle
 
     with patch.object(controller, "_supports_google_search", return_value=True):
@@ -1114,8 +1105,7 @@ async def test_adjust_url_context_disable(controller, mock_check_disconnect, moc
     """Test disabling URL context."""
     switch = AsyncMock()
     # Initially enabled
-    switch.get_attribute.return_value = "true"
-    switch.count.return_value = 1
+    switch.evaluate_all.return_value = toggle_state(checked=True)
     mock_page.locator.return_value = switch
 
     await controller._adjust_url_context(False, mock_check_disconnect)
@@ -1155,3 +1145,57 @@ async def test_adjust_parameters_fc_active_disables_url_context(
 
         # Verify it called _adjust_url_context(False, ...)
         mock_url_adj.assert_called_with(False, mock_check_disconnect)
+
+
+@pytest.mark.asyncio
+async def test_adjust_google_search_disabled_toggle_skipped(
+    controller, mock_check_disconnect, mock_page
+):
+    """A disabled toggle is detected from the same read and not clicked."""
+    request_params = {"tools": [{"function": {"name": "googleSearch"}}]}
+    toggle = AsyncMock()
+    toggle.evaluate_all.return_value = toggle_state(checked=False, disabled=True)
+    mock_page.locator.return_value = toggle
+
+    with patch.object(controller, "_supports_google_search", return_value=True):
+        await controller._adjust_google_search(
+            request_params, "gemini-flash", mock_check_disconnect
+        )
+
+    toggle.evaluate_all.assert_awaited_once()
+    toggle.get_attribute.assert_not_called()
+    toggle.click.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_adjust_url_context_not_found(
+    controller, mock_check_disconnect, mock_page
+):
+    """No URL Context toggle on the page skips the adjustment."""
+    switch = AsyncMock()
+    switch.evaluate_all.return_value = None
+    mock_page.locator.return_value = switch
+
+    await controller._adjust_url_context(True, mock_check_disconnect)
+
+    switch.click.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_adjust_google_search_toggle_gone_after_visible(
+    controller, mock_check_disconnect, mock_page, mock_logger
+):
+    """A toggle that vanishes between the visibility wait and the re-read is skipped."""
+    request_params = {"tools": [{"function": {"name": "googleSearch"}}]}
+    toggle = AsyncMock()
+    toggle.evaluate_all.side_effect = [toggle_state(checked=False, visible=False), None]
+    mock_page.locator.return_value = toggle
+
+    with patch.object(controller, "_supports_google_search", return_value=True):
+        await controller._adjust_google_search(
+            request_params, "gemini-flash", mock_check_disconnect
+        )
+
+    toggle.click.assert_not_called()
+    mock_logger.warning.assert_called()
+    mock_logger.error.assert_not_called()
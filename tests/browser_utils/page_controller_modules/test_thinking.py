@@ -10,6 +10,11 @@ from browser_utils.page_controller_modules.thinking import (
 )
 
 
+def toggle_state(checked, visible=True, disabled=False):
+    """State dict returned by the fused toggle read."""
+    return {"visible": visible, "checked": checked, "disabled": disabled}
+
+
 @pytest.fixture
 def mock_controller(mock_page):
     logger = MagicMock()
@@ -416,7 +421,8 @@ async def test_control_thinking_budget_toggle(mock_controller, mock_page):
     mock_page.locator.return_value = toggle
 
     # Initial state: false. Desired: true.
-    toggle.get_attribute.side_effect = ["false", "true"]  # Before click, after click
+    toggle.evaluate_all.return_value = toggle_state(checked=False)
+    toggle.get_attribute.side_effect = ["true"]  # After click
 
     mock_expect = MagicMock()
     mock_expect.return_value.to_be_visible = AsyncMock()
@@ -433,7 +439,7 @@ async def test_control_thinking_budget_toggle(mock_controller, mock_page):
         toggle.click.assert_called()
 
     # Test verify failure
-    toggle.get_attribute.side_effect = ["false", "false"]  # Fails to change
+    toggle.get_attribute.side_effect = ["false"]  # Fails to change
     with patch(
         "browser_utils.page_controller_modules.thinking.expect_async", mock_expect
     ):
@@ -906,7 +912,7 @@ async def test_set_thinking_level_errors(mock_controller):
 async def test_control_thinking_mode_toggle_fallback(mock_controller):
     # Test fallback to aria-label based toggle click
     toggle = MagicMock()
-    toggle.count = AsyncMock(return_value=1)  # Element exists
+    toggle.evaluate_all = AsyncMock(return_value=toggle_state(checked=False))
     toggle.get_attribute = AsyncMock(return_value="false")
     toggle.click = AsyncMock(side_effect=Exception("Click failed"))
 
@@ -945,7 +951,7 @@ async def test_control_thinking_mode_toggle_fallback(mock_controller):
 async def test_control_thinking_budget_toggle_fallback(mock_controller):
     # Test fallback to aria-label based toggle click
     toggle = MagicMock()
-    toggle.count = AsyncMock(return_value=1)  # Element exists
+    toggle.evaluate_all = AsyncMock(return_value=toggle_state(checked=False))
     toggle.get_attribute = AsyncMock(return_value="false")
     toggle.click = AsyncMock(side_effect=Exception("Click failed"))
 
@@ -1514,7 +1520,8 @@ async def test_control_thinking_mode_toggle_fallback_success(
 ):
     """Test successful fallback to aria-label based toggle click."""
     toggle = AsyncMock()
-    toggle.get_attribute = AsyncMock(side_effect=["false", "true"])  # Before and after
+    toggle.evaluate_all = AsyncMock(return_value=toggle_state(checked=False))
+    toggle.get_attribute = AsyncMock(return_value="true")  # After click
     toggle.click = AsyncMock(side_effect=Exception("Click failed"))
     toggle.scroll_into_view_if_needed = AsyncMock()
 
@@ -1595,7 +1602,7 @@ async def test_control_thinking_mode_toggle_already_correct_state(
 ):
     """Test toggle already in desired state (lines 488-489)."""
     toggle = AsyncMock()
-    toggle.get_attribute = AsyncMock(return_value="true")
+    toggle.evaluate_all = AsyncMock(return_value=toggle_state(checked=True))
     toggle.scroll_into_view_if_needed = AsyncMock()
 
     mock_page.locator.return_value = toggle
@@ -1631,7 +1638,9 @@ async def test_control_thinking_mode_toggle_top_level_errors(
     from models import ClientDisconnectedError
 
     # Test TimeoutError (lines 491-495)
-    mock_page.locator.return_value = AsyncMock()
+    hidden_toggle = AsyncMock()
+    hidden_toggle.evaluate_all.return_value = toggle_state(checked=False, visible=False)
+    mock_page.locator.return_value = hidden_toggle
 
     mock_expect = MagicMock()
     mock_expect.return_value.to_be_visible = AsyncMock(
@@ -1805,7 +1814,7 @@ async def test_control_thinking_budget_toggle_already_correct(
 ):
     """Test budget toggle already in desired state (lines 572-573)."""
     toggle = AsyncMock()
-    toggle.get_attribute = AsyncMock(return_value="true")
+    toggle.evaluate_all = AsyncMock(return_value=toggle_state(checked=True))
     toggle.scroll_into_view_if_needed = AsyncMock()
 
     mock_page.locator.return_value = toggle
@@ -1841,7 +1850,9 @@ async def test_control_thinking_budget_toggle_top_level_errors(
     from models import ClientDisconnectedError
 
     # Test CancelledError (lines 575-576)
-    mock_page.locator.return_value = AsyncMock()
+    hidden_toggle = AsyncMock()
+    hidden_toggle.evaluate_all.return_value = toggle_state(checked=False, visible=False)
+    mock_page.locator.return_value = hidden_toggle
 
     mock_expect = MagicMock()
     mock_expect.return_value.to_be_visible = AsyncMock(
@@ -2041,3 +2052,88 @@ async def test_handle_thinking_budget_default_level_flash(mock_controller):
 
     # Should use DEFAULT_THINKING_LEVEL_FLASH
     mock_controller._set_thinking_level.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_control_thinking_mode_toggle_reads_state_once(
+    mock_controller, mock_page
+):
+    """A visible toggle in the expected state needs a single browser read."""
+    toggle = AsyncMock()
+    toggle.evaluate_all.return_value = toggle_state(checked=True)
+    mock_page.locator.return_value = toggle
+
+    mock_expect = MagicMock()
+    mock_expect.return_value.to_be_visible = AsyncMock()
+
+    with patch(
+        "browser_utils.page_controller_modules.thinking.expect_async", mock_expect
+    ):
+        result = await mock_controller._control_thinking_mode_toggle(
+            True, MagicMock(return_value=False)
+        )
+
+    assert result is True
+    toggle.evaluate_all.assert_awaited_once()
+    mock_expect.return_value.to_be_visible.assert_not_called()
+    toggle.count.assert_not_called()
+    toggle.get_attribute.assert_not_called()
+    toggle.click.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_control_thinking_budget_toggle_not_found(mock_controller, mock_page):
+    """No matching toggle skips the control without waiting for visibility."""
+    toggle = AsyncMock()
+    toggle.evaluate_all.return_value = None
+    mock_page.locator.return_value = toggle
+
+    await mock_controller._control_thinking_budget_toggle(
+        True, MagicMock(return_value=False)
+    )
+
+    toggle.click.assert_not_called()
+    mock_controller.logger.warning.assert_called()
+
+
+def test_thinking_category_is_cached_per_model_id(mock_controller):
+    """Repeated lookups for the same model ID hit the category cache."""
+    from browser_utils.page_controller_modules.thinking import (
+        _thinking_category_for,
+    )
+
+    _thinking_category_for.cache_clear()
+    for _ in range(3):
+        assert (
+            mock_controller._get_thinking_category("Gemini-2.5-Pro")
+            == ThinkingCategory.THINKING_PRO
+        )
+
+    info = _thinking_category_for.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_control_thinking_mode_toggle_gone_after_visible(
+    mock_controller, mock_page
+):
+    """A toggle that vanishes after the visibility wait is handled like not found."""
+    toggle = AsyncMock()
+    toggle.evaluate_all.side_effect = [toggle_state(checked=False, visible=False), None]
+    mock_page.locator.return_value = toggle
+
+    mock_expect = MagicMock()
+    mock_expect.return_value.to_be_visible = AsyncMock()
+
+    with patch(
+        "browser_utils.page_controller_modules.thinking.expect_async", mock_expect
+    ):
+        result = await mock_controller._control_thinking_mode_toggle(
+            True, MagicMock(return_value=False)
+        )
+
+    assert result is False
+    toggle.click.assert_not_called()
+    mock_controller.logger.warning.assert_called()
+    mock_controller.logger.error.assert_not_called()
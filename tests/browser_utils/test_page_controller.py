@@ -73,3 +73,67 @@ async def test_page_controller_check_disconnect(mock_page: MagicMock):
         await controller._check_disconnect(
             stage="test stage", check_client_disconnected=mock_check_func
         )
+
+
+@pytest.mark.asyncio
+async def test_page_controller_wait_for_body_text_uses_observer(mock_page: MagicMock):
+    """wait_for_body_text resolves in one evaluate round-trip."""
+    from config.selectors import FINAL_RESPONSE_SELECTOR
+
+    mock_page.evaluate = AsyncMock(return_value="Final answer")
+    controller = PageController(mock_page, MagicMock(), "test_req_id")
+
+    assert await controller.wait_for_body_text(timeout_ms=2000) == "Final answer"
+    mock_page.evaluate.assert_awaited_once()
+    assert mock_page.evaluate.call_args[0][1] == [FINAL_RESPONSE_SELECTOR, 2000]
+
+
+@pytest.mark.asyncio
+async def test_page_controller_wait_for_body_text_falls_back_to_polling(
+    mock_page: MagicMock,
+):
+    """wait_for_body_text polls the DOM when the observer script fails."""
+    mock_page.evaluate = AsyncMock(side_effect=Exception("script error"))
+    controller = PageController(mock_page, MagicMock(), "test_req_id")
+
+    with (
+        patch.object(
+            controller,
+            "get_body_text_only_from_dom",
+            new_callable=AsyncMock,
+            side_effect=["", "  ", "Late answer"],
+        ) as mock_get,
+        patch("asyncio.sleep", new_callable=AsyncMock),
+    ):
+        assert await controller.wait_for_body_text(timeout_ms=2000) == "Late answer"
+
+    assert mock_get.await_count == 3
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("", ("", "")),
+        ("plain answer", ("plain answer", "")),
+        (
+            "[THINKING]step 1\nstep 2[/THINKING]\nanswer",
+            ("answer", "step 1\nstep 2"),
+        ),
+        (
+            "a [THINKING]x[/THINKING] b [THINKING]y[/THINKING] c",
+            ("a  b  c", "x\ny"),
+        ),
+        (
+            "[THINKING]unterminated answer",
+            ("[THINKING]unterminated answer", ""),
+        ),
+        ("  [THINKING]  [/THINKING]  ", ("", "")),
+    ],
+)
+def test_page_controller_separate_thinking_and_response(
+    mock_page: MagicMock, content, expected
+):
+    """Test thinking blocks are split out of the response text."""
+    controller = PageController(mock_page, MagicMock(), "test_req_id")
+
+    assert controller._separate_thinking_and_response(content) == expected
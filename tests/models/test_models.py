@@ -1,3 +1,5 @@
+import pytest
+
 from models.chat import (
     AudioInput,
     ChatCompletionRequest,
@@ -110,3 +112,23 @@ def test_chat_completion_request_model():
     req_stream = ChatCompletionRequest(messages=[msg], stream=True, temperature=0.7)
     assert req_stream.stream is True
     assert req_stream.temperature == 0.7
+
+
+def test_package_exports_resolve_lazily():
+    """Package-level names resolve to the submodule objects and are cached."""
+    import models
+    import models.chat as chat_module
+    from models.exceptions import ClientDisconnectedError
+
+    assert models.ChatCompletionRequest is chat_module.ChatCompletionRequest
+    assert models.ClientDisconnectedError is ClientDisconnectedError
+    assert "ChatCompletionRequest" in vars(models)
+    assert set(models.__all__) <= set(dir(models))
+
+
+def test_package_unknown_attribute_raises():
+    """Unknown names still raise AttributeError."""
+    import models
+
+    with pytest.raises(AttributeError):
+        models.DoesNotExist  # noqa: B018
@@ -359,6 +359,30 @@ class TestHttpInterceptorEdgeCases:
         assert result["reason"] == ""
         assert result["function"] == []
 
+    def test_parse_toolcall_params_skips_debug_formatting_when_disabled(
+        self, interceptor
+    ):
+        """Per-param debug lines are not built unless DEBUG is enabled."""
+        import logging
+        from unittest.mock import patch
+
+        args = [
+            [
+                ["p_str", [1, 2, "abc"]],
+                ["p_arr", [None, None, None, None, None, [[None, None, "x"]]]],
+            ]
+        ]
+        original_level = interceptor.logger.level
+        interceptor.logger.setLevel(logging.INFO)
+        try:
+            with patch.object(interceptor.logger, "debug") as mock_debug:
+                params = interceptor.parse_toolcall_params(args)
+        finally:
+            interceptor.logger.setLevel(original_level)
+
+        assert params == {"p_str": "abc", "p_arr": ["x"]}
+        mock_debug.assert_not_called()
+
     def test_parse_toolcall_params_with_invalid_structure(self, interceptor):
         """
         Test scenario: invalid args format passed to parse_toolcall_params
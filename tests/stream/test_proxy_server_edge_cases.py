@@ -207,8 +207,6 @@ async def test_forward_data_with_interception_http_error_response(
     1. Log the error
     2. Send an error payload to the queue (fail-fast)
     """
-    import json
-
     client_reader = AsyncMock()
     client_writer = MagicMock()
     client_writer.write = MagicMock()
@@ -237,8 +235,7 @@ async def test_forward_data_with_interception_http_error_response(
 
     # Verify error payload was sent to queue
     mock_queue.put.assert_called()
-    call_args = mock_queue.put.call_args[0][0]
-    parsed = json.loads(call_args)
+    parsed = mock_queue.put.call_args[0][0]
     assert parsed["error"] is True
     assert parsed["status"] == 429
     assert "429" in parsed["message"]
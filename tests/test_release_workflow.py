@@ -19,19 +19,27 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 WORKFLOW_PATH = REPO_ROOT / ".github" / "workflows" / "release.yml"
 
 
-def _read_release_workflow() -> str:
-    """Read the release workflow file with explicit error handling."""
+_DOCS_GUIDES_RE = re.compile(r"docs/guides/[A-Za-z0-9._/-]+")
+_THANK_YOU_RE = re.compile(r"\*\*Thank you to all contributors!\*\*")
+
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@pytest.fixture(scope="module")
+def workflow_content() -> str:
+    """Read the release workflow file once per module."""
     try:
         return WORKFLOW_PATH.read_text(encoding="utf-8")
     except FileNotFoundError as exc:
         pytest.fail(f"Release workflow not found at {WORKFLOW_PATH}: {exc}")
 
 
-def _load_release_workflow_yaml() -> dict:
-    """Parse the release workflow YAML and fail with context on errors."""
-    content = _read_release_workflow()
+@pytest.fixture(scope="module")
+def workflow_data(workflow_content: str) -> dict:
+    """Parse the release workflow YAML once and fail with context on errors."""
     try:
-        data = yaml.safe_load(content)
+        data = yaml.load(workflow_content, Loader=_YAML_LOADER)
     except yaml.YAMLError as exc:
         pytest.fail(f"Invalid YAML syntax in {WORKFLOW_PATH}: {exc}")
     if not isinstance(data, dict):
@@ -55,21 +63,18 @@ def _extract_step_block(content: str, step_name: str) -> str:
 class TestReleaseWorkflow:
     """Release workflow validation tests."""
 
-    def test_yaml_syntax_is_valid_and_has_jobs(self) -> None:
+    def test_yaml_syntax_is_valid_and_has_jobs(self, workflow_data: dict) -> None:
         """Happy path: YAML parses and includes expected top-level keys."""
-        # Arrange
-        # Act
-        data = _load_release_workflow_yaml()
-
         # Assert
-        assert data, "Release workflow YAML should not be empty"
-        assert "jobs" in data, "Release workflow should define jobs"
+        assert workflow_data, "Release workflow YAML should not be empty"
+        assert "jobs" in workflow_data, "Release workflow should define jobs"
 
-    def test_stable_changelog_uses_github_username_and_fallback_author(self) -> None:
+    def test_stable_changelog_uses_github_username_and_fallback_author(
+        self, workflow_content: str
+    ) -> None:
         """Boundary: stable changelog should use GitHub username lookup with fallback."""
         # Arrange
-        content = _read_release_workflow()
-        stable_step = _extract_step_block(content, "Generate changelog")
+        stable_step = _extract_step_block(workflow_content, "Generate changelog")
 
         # Act
         has_commit_api_lookup = (
@@ -97,11 +102,12 @@ class TestReleaseWorkflow:
             "Stable changelog must not use direct git author formatting '- %s by %an (%h)'"
         )
 
-    def test_nightly_changes_use_github_username_and_fallback_author(self) -> None:
+    def test_nightly_changes_use_github_username_and_fallback_author(
+        self, workflow_content: str
+    ) -> None:
         """Boundary: nightly changes should use GitHub username lookup with fallback."""
         # Arrange
-        content = _read_release_workflow()
-        nightly_step = _extract_step_block(content, "Generate recent changes")
+        nightly_step = _extract_step_block(workflow_content, "Generate recent changes")
 
         # Act
         has_commit_api_lookup = (
@@ -130,11 +136,12 @@ class TestReleaseWorkflow:
             "Nightly changes must not use direct git author formatting '- %s by %an (%h)'"
         )
 
-    def test_nightly_changelog_uses_latest_stable_tag_range(self) -> None:
+    def test_nightly_changelog_uses_latest_stable_tag_range(
+        self, workflow_content: str
+    ) -> None:
         """Happy path: nightly changelog should use latest stable tag range."""
         # Arrange
-        content = _read_release_workflow()
-        nightly_step = _extract_step_block(content, "Generate recent changes")
+        nightly_step = _extract_step_block(workflow_content, "Generate recent changes")
 
         # Act
         has_latest_stable_tag_lookup = (
@@ -157,11 +164,12 @@ class TestReleaseWorkflow:
             "Nightly changelog must not use a fixed -10 commit range"
         )
 
-    def test_nightly_changelog_fallback_when_no_stable_tag(self) -> None:
+    def test_nightly_changelog_fallback_when_no_stable_tag(
+        self, workflow_content: str
+    ) -> None:
         """Null/empty: nightly changelog should fall back when no stable tag exists."""
         # Arrange
-        content = _read_release_workflow()
-        nightly_step = _extract_step_block(content, "Generate recent changes")
+        nightly_step = _extract_step_block(workflow_content, "Generate recent changes")
 
         # Act
         has_fallback_log = 'git log --pretty=format:"%H" -20' in nightly_step
@@ -178,11 +186,10 @@ class TestReleaseWorkflow:
             "Nightly changelog must include a fallback note when no stable tag exists"
         )
 
-    def test_nightly_changelog_includes_range_note(self) -> None:
+    def test_nightly_changelog_includes_range_note(self, workflow_content: str) -> None:
         """Boundary: nightly changelog should include range and fallback notes."""
         # Arrange
-        content = _read_release_workflow()
-        nightly_step = _extract_step_block(content, "Generate recent changes")
+        nightly_step = _extract_step_block(workflow_content, "Generate recent changes")
 
         # Act
         has_range_note = "_Changes since ${LATEST_STABLE_TAG}_" in nightly_step
@@ -199,14 +206,10 @@ class TestReleaseWorkflow:
             "Nightly changelog must include a fallback note when no stable tag exists"
         )
 
-    def test_docs_guides_links_are_not_broken(self) -> None:
+    def test_docs_guides_links_are_not_broken(self, workflow_content: str) -> None:
         """Invalid/malformed: docs/guides links must resolve to files."""
-        # Arrange
-        content = _read_release_workflow()
-        pattern = re.compile(r"docs/guides/[A-Za-z0-9._/-]+")
-
         # Act
-        referenced_paths = pattern.findall(content)
+        referenced_paths = _DOCS_GUIDES_RE.findall(workflow_content)
 
         # Assert
         if not referenced_paths:
@@ -217,15 +220,12 @@ class TestReleaseWorkflow:
             full_path = REPO_ROOT / sanitized
             assert full_path.exists(), f"Broken documentation link: {sanitized}"
 
-    def test_contributor_acknowledgement_uses_thank_you_message(self) -> None:
+    def test_contributor_acknowledgement_uses_thank_you_message(
+        self, workflow_content: str
+    ) -> None:
         """Error condition: workflow must include the thank-you contributor message."""
-        # Arrange
-        content = _read_release_workflow()
-
         # Act
-        thank_you_occurrences = len(
-            re.findall(r"\*\*Thank you to all contributors!\*\*", content)
-        )
+        thank_you_occurrences = len(_THANK_YOU_RE.findall(workflow_content))
 
         # Assert
         assert thank_you_occurrences >= 2, (
@@ -233,14 +233,13 @@ class TestReleaseWorkflow:
             "in both stable and nightly release sections"
         )
 
-    def test_contributor_list_generation_is_removed(self) -> None:
+    def test_contributor_list_generation_is_removed(
+        self, workflow_content: str
+    ) -> None:
         """Error condition: contributor list files should not be generated in workflow."""
-        # Arrange
-        content = _read_release_workflow()
-
         # Act
-        has_stable_contributors_file = "CONTRIBUTORS.md" in content
-        has_nightly_contributors_file = "NIGHTLY_CONTRIBUTORS.md" in content
+        has_stable_contributors_file = "CONTRIBUTORS.md" in workflow_content
+        has_nightly_contributors_file = "NIGHTLY_CONTRIBUTORS.md" in workflow_content
 
         # Assert
         assert not has_stable_contributors_file, (
@@ -250,14 +249,13 @@ class TestReleaseWorkflow:
             "Nightly release workflow must not generate NIGHTLY_CONTRIBUTORS.md"
         )
 
-    def test_readme_reference_exists_for_installation_instructions(self) -> None:
+    def test_readme_reference_exists_for_installation_instructions(
+        self, workflow_content: str
+    ) -> None:
         """Null/empty: README reference should exist for installation guidance."""
-        # Arrange
-        content = _read_release_workflow()
-
         # Act
-        has_installation_section = "## Installation" in content
-        has_readme_reference = "README.md" in content
+        has_installation_section = "## Installation" in workflow_content
+        has_readme_reference = "README.md" in workflow_content
 
         # Assert
         assert has_installation_section, (